@@ -3,6 +3,8 @@ Dependency checker for pzmapdzi2img
 
 Automatically checks for and offers to install missing dependencies.
 """
+import os
+import site
 import sys
 import subprocess
 from pathlib import Path
@@ -171,6 +173,58 @@ def prompt_install_missing():
     return False
 
 
+def check_dependencies_cached():
+    """
+    Check dependencies, skipping the check if nothing changed since it last passed
+    
+    A marker file in the user cache directory records the interpreter and
+    the state of its site-packages when the check last succeeded. Installing,
+    upgrading or removing packages changes site-packages, so the full check
+    (and install prompt) runs again.
+    
+    Returns:
+        bool: True if all dependencies are available, False otherwise
+    """
+    marker = _get_dependency_marker_path()
+    key = _get_dependency_cache_key()
+    
+    try:
+        if marker.read_text(encoding='utf-8') == key:
+            return True
+    except OSError:
+        pass  # No marker yet (or unreadable) - run the full check
+    
+    if not prompt_install_missing():
+        return False
+    
+    # Check passed (possibly after installing) - recompute, since installing
+    # packages changes site-packages
+    try:
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.write_text(_get_dependency_cache_key(), encoding='utf-8')
+    except OSError:
+        pass  # Caching is best-effort
+    
+    return True
+
+
+def _get_dependency_marker_path():
+    """Path of the marker file recording a passed dependency check"""
+    cache_root = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    version = f"{sys.version_info.major}.{sys.version_info.minor}"
+    return Path(cache_root) / 'pzmapdzi2img' / f"deps-{version}.ok"
+
+
+def _get_dependency_cache_key():
+    """Identify this interpreter and the current state of its installed packages"""
+    site_dirs = list(site.getsitepackages()) if hasattr(site, 'getsitepackages') else []
+    if site.ENABLE_USER_SITE:
+        site_dirs.append(site.getusersitepackages())
+    
+    mtimes = [os.path.getmtime(d) for d in site_dirs if os.path.isdir(d)]
+    return f"{sys.executable}\n{sys.version}\n{max(mtimes, default=0)}"
+
+
 if __name__ == "__main__":
     # Test the dependency checker
     if prompt_install_missing():
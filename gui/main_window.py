@@ -12,6 +12,11 @@ from .map_selector import MapSelector
 from .layer_level_selector import LayerLevelSelector
 from .output_config import OutputConfig
 from map_image_generator.stitcher import stitch_multi_map
+from map_image_generator.tile_loader import clear_tile_cache, set_tile_cache_budget
+
+# Decoded tiles kept between generations, so regenerating the same maps
+# (another format, layer set or output path) doesn't decode them again
+TILE_CACHE_BYTES = 256 * 1024 * 1024
 
 
 class MainWindow:
@@ -229,6 +234,7 @@ class MainWindow:
     
     def on_maps_discovered(self, maps):
         """Callback when maps are discovered by path selector"""
+        clear_tile_cache()
         self.map_selector.populate_maps(maps)
         
         # Store all maps for later filtering
@@ -247,6 +253,9 @@ class MainWindow:
         """Callback when map selection changes (checkbox toggled)"""
         print(f"DEBUG: on_map_selection_changed called, all_maps has {len(self.all_maps)} items")
         
+        # Cached tiles belong to the previous selection
+        clear_tile_cache()
+        
         # Get only the selected maps
         selected_map_paths = self.map_selector.get_selected_maps()
         print(f"DEBUG: Selected {len(selected_map_paths)} maps")
@@ -297,6 +306,7 @@ class MainWindow:
         output_path = self.output_config.get_output_path()
         output_format = self.output_config.get_format()
         jpeg_quality = self.output_config.get_quality()
+        png_high_compression = self.output_config.get_png_high_compression()
         
         # Validation (should already be done, but double-check)
         if not selected_map_paths:
@@ -329,13 +339,13 @@ class MainWindow:
         thread = threading.Thread(
             target=self._generate_image_thread,
             args=(selected_map_paths, selected_layers, selected_level, 
-                  output_path, output_format, jpeg_quality)
+                  output_path, output_format, jpeg_quality, png_high_compression)
         )
         thread.daemon = True
         thread.start()
     
     def _generate_image_thread(self, map_paths, layers, level, output_path, 
-                              output_format, jpeg_quality):
+                              output_format, jpeg_quality, png_high_compression=False):
         """
         Run image generation in background thread.
         
@@ -344,9 +354,12 @@ class MainWindow:
         """
         try:
             from PIL import Image
-            from map_image_generator.bounds import calculate_global_bounds
-            from map_image_generator.stitcher import _calculate_map_levels, _stitch_map_onto_canvas, _save_image
-            from map_image_generator.tile_loader import load_tiles_for_level
+            from map_image_generator.bounds import calculate_global_bounds_packed
+            from map_image_generator.stitcher import (
+                _calculate_map_levels, _stitch_map_onto_canvas, _save_image, PNG_COMPRESS_LEVEL
+            )
+            
+            set_tile_cache_budget(TILE_CACHE_BYTES)
             
             # Weight the steps: save typically takes 80-90% of total time
             # Give save operation a weight of 50 "virtual steps" to reflect this
@@ -360,7 +373,7 @@ class MainWindow:
             self.root.after(0, self.update_progress, current_step, total_steps, 
                           "Calculating global bounds...")
             
-            bounds = calculate_global_bounds(map_paths, layers[0])
+            bounds = calculate_global_bounds_packed(map_paths, layers[0])
             
             # Step 2: Calculate zoom levels
             current_step += 1
@@ -379,6 +392,8 @@ class MainWindow:
             combined_image = Image.new('RGBA', (canvas_width, canvas_height), (0, 0, 0, 0))
             
             # Stitch each layer onto the same canvas
+            # painted_rects lets tiles over still-empty canvas skip blending
+            painted_rects = []
             for layer_idx, layer in enumerate(layers, 1):
                 for map_idx, map_path in enumerate(map_paths, 1):
                     current_step += 1
@@ -394,7 +409,8 @@ class MainWindow:
                         layer=layer,
                         map_levels=map_levels,
                         bounds=bounds,
-                        scale_factor=scale_factor
+                        scale_factor=scale_factor,
+                        painted_rects=painted_rects
                     )
             
             # Prepare for save
@@ -409,7 +425,7 @@ class MainWindow:
                 self.root.after(0, self.update_progress, current_step, total_steps,
                               "Converting to JPEG format...")
                 background = Image.new('RGB', combined_image.size, (255, 255, 255))
-                background.paste(combined_image, mask=combined_image.split()[3])
+                background.paste(combined_image, mask=combined_image)  # Uses alpha band, no copy
                 save_image = background
             
             # Create directory
@@ -427,7 +443,10 @@ class MainWindow:
             elif save_format == 'WEBP':
                 save_kwargs = {'quality': 95, 'method': 6}
             elif save_format == 'PNG':
-                save_kwargs = {'optimize': True}
+                if png_high_compression:
+                    save_kwargs = {'optimize': True}
+                else:
+                    save_kwargs = {'compress_level': PNG_COMPRESS_LEVEL}
             
             # Actual save (blocking operation that takes most of the time)
             save_image.save(output_path, format=save_format, **save_kwargs)
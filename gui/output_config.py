@@ -28,9 +28,11 @@ class OutputConfig:
         self.output_path_var = tk.StringVar()
         self.format_var = tk.StringVar(value="PNG")
         self.quality_var = tk.IntVar(value=85)
+        self.png_high_compression_var = tk.BooleanVar(value=False)
         
         # Widget references
         self.quality_frame = None
+        self.png_frame = None
         self.generate_button = None
         
         # Default output path
@@ -140,6 +142,23 @@ class OutputConfig:
         )
         self.quality_label.pack(side=tk.LEFT)
         
+        # PNG compression option (shown while PNG is selected)
+        self.png_frame = ttk.Frame(self.parent)
+        self.png_frame.pack(fill=tk.X, pady=styles.PAD_SMALL)
+        
+        ttk.Label(
+            self.png_frame,
+            text="PNG Size:",
+            width=12
+        ).pack(side=tk.LEFT)
+        
+        self.png_compression_check = ttk.Checkbutton(
+            self.png_frame,
+            text="Smaller file (much slower save)",
+            variable=self.png_high_compression_var
+        )
+        self.png_compression_check.pack(side=tk.LEFT)
+        
         # Generate button
         button_frame = ttk.Frame(self.parent)
         button_frame.pack(fill=tk.X, pady=(styles.PAD_MEDIUM, 0))
@@ -214,6 +233,12 @@ class OutputConfig:
         else:
             self.quality_frame.pack_forget()
         
+        # Show/hide compression option for PNG
+        if selected_format == "PNG":
+            self.png_frame.pack(fill=tk.X, pady=styles.PAD_SMALL, before=self.generate_button.master)
+        else:
+            self.png_frame.pack_forget()
+        
         # Update file extension in output path
         current_path = self.output_path_var.get()
         if current_path:
@@ -260,6 +285,7 @@ class OutputConfig:
         self.jpeg_radio.config(state=state)
         self.webp_radio.config(state=state)
         self.quality_slider.config(state=state)
+        self.png_compression_check.config(state=state)
         
         # Don't enable generate button here - use enable_generate() instead
     
@@ -305,6 +331,15 @@ class OutputConfig:
             return self.quality_var.get()
         return None
     
+    def get_png_high_compression(self):
+        """
+        Get the PNG high compression setting.
+        
+        Returns:
+            True to save a smaller PNG (slower) if PNG selected, else False
+        """
+        return self.format_var.get() == "PNG" and self.png_high_compression_var.get()
+    
     def update_default_filename(self, selected_layers, selected_level):
         """
         Update the default output filename based on selections.
@@ -5,12 +5,19 @@ This module calculates the bounding box that encompasses multiple maps
 with different positions and dimensions in world space.
 """
 
+import logging
+from array import array
 from pathlib import Path
 from typing import List, Dict, Any
 from .map_info import read_map_info
 from .dzi_parser import parse_dzi
 from .pyramid import get_max_level
 
+logger = logging.getLogger(__name__)
+
+# Column order of each row in calculate_global_bounds_packed()['packed']
+PACKED_MAP_FIELDS = ('x0', 'y0', 'w', 'h', 'offset_x', 'offset_y')
+
 
 def calculate_global_bounds(map_paths: List[Path], layer: int = 0) -> Dict[str, Any]:
     """
@@ -34,43 +41,10 @@ def calculate_global_bounds(map_paths: List[Path], layer: int = 0) -> Dict[str,
         FileNotFoundError: If map_info.json not found in any map path
         ValueError: If no valid maps found or layer invalid
     """
-    if not map_paths:
-        raise ValueError("No map paths provided")
-    
-    # Load all map metadata and determine max levels
-    maps_data = []
-    max_levels = []
-    
-    for map_path in map_paths:
-        try:
-            info = read_map_info(map_path)
-            
-            # Get this map's max level
-            dzi_file = map_path / f"layer{layer}.dzi"
-            dzi_info = parse_dzi(dzi_file)
-            max_level = get_max_level(dzi_info['width'], dzi_info['height'])
-            max_levels.append(max_level)
-            
-            # x0/y0 are negative world coordinates - negate to get actual position
-            world_x = -info['x0']
-            world_y = -info['y0']
-            
-            maps_data.append({
-                'name': map_path.name,
-                'path': map_path,
-                'info': info,
-                'world_x': world_x,
-                'world_y': world_y,
-                'max_level': max_level
-            })
-        except FileNotFoundError:
-            raise FileNotFoundError(f"map_info.json not found in {map_path}")
-    
-    if not maps_data:
-        raise ValueError("No valid maps found")
+    maps_data = _load_maps_data(map_paths, layer)
     
     # Find the highest max level among all maps
-    highest_max_level = max(max_levels)
+    highest_max_level = max(m['max_level'] for m in maps_data)
     
     # Calculate global bounding box
     # Note: w/h are already in world coordinate space - no normalization needed
@@ -111,6 +85,102 @@ def calculate_global_bounds(map_paths: List[Path], layer: int = 0) -> Dict[str,
     }
 
 
+def calculate_global_bounds_packed(map_paths: List[Path], layer: int = 0) -> Dict[str, Any]:
+    """
+    Calculate the global bounding box with per-map data in packed form.
+    
+    Same as calculate_global_bounds(), but instead of one dict per map the
+    per-map values are stored in a flat array.array('q') with one row of
+    PACKED_MAP_FIELDS per map. Useful for callers that only need the
+    numeric placement of many maps (e.g. viewport culling).
+    
+    Args:
+        map_paths: List of paths to map directories (containing map_info.json)
+        layer: Layer number (used for validation, not calculation)
+        
+    Returns:
+        Dictionary with keys:
+        - min_x, min_y, max_x, max_y, width, height: As calculate_global_bounds()
+        - names: List of map names, in row order
+        - packed: array('q') of len(names) * len(PACKED_MAP_FIELDS) values;
+          row i starts at i * len(PACKED_MAP_FIELDS)
+        
+    Raises:
+        FileNotFoundError: If map_info.json not found in any map path
+        ValueError: If no valid maps found or layer invalid
+        
+    Example:
+        >>> result = calculate_global_bounds_packed(map_paths)
+        >>> stride = len(PACKED_MAP_FIELDS)
+        >>> x0, y0, w, h, offset_x, offset_y = result['packed'][0:stride]
+    """
+    maps_data = _load_maps_data(map_paths, layer)
+    
+    min_x = min(m['world_x'] for m in maps_data)
+    min_y = min(m['world_y'] for m in maps_data)
+    max_x = max(m['world_x'] + m['info']['w'] for m in maps_data)
+    max_y = max(m['world_y'] + m['info']['h'] for m in maps_data)
+    
+    names = []
+    packed = array('q')
+    for m in maps_data:
+        info = m['info']
+        names.append(m['name'])
+        packed.extend((
+            info['x0'],
+            info['y0'],
+            info['w'],
+            info['h'],
+            m['world_x'] - min_x,
+            m['world_y'] - min_y
+        ))
+    
+    return {
+        'min_x': min_x,
+        'min_y': min_y,
+        'max_x': max_x,
+        'max_y': max_y,
+        'width': max_x - min_x,
+        'height': max_y - min_y,
+        'names': names,
+        'packed': packed
+    }
+
+
+def _load_maps_data(map_paths: List[Path], layer: int) -> List[Dict[str, Any]]:
+    """Read map_info.json and DZI max level for each map, with world position."""
+    if not map_paths:
+        raise ValueError("No map paths provided")
+    
+    maps_data = []
+    
+    for map_path in map_paths:
+        try:
+            info = read_map_info(map_path)
+            
+            # Get this map's max level
+            dzi_file = map_path / f"layer{layer}.dzi"
+            dzi_info = parse_dzi(dzi_file)
+            max_level = get_max_level(dzi_info['width'], dzi_info['height'])
+            
+            # x0/y0 are negative world coordinates - negate to get actual position
+            maps_data.append({
+                'name': map_path.name,
+                'path': map_path,
+                'info': info,
+                'world_x': -info['x0'],
+                'world_y': -info['y0'],
+                'max_level': max_level
+            })
+        except FileNotFoundError:
+            raise FileNotFoundError(f"map_info.json not found in {map_path}")
+    
+    if not maps_data:
+        raise ValueError("No valid maps found")
+    
+    return maps_data
+
+
 def get_map_offset(map_info: Dict[str, Any], global_bounds: Dict[str, Any]) -> tuple[int, int]:
     """
     Calculate where a map should be positioned in the global canvas.
@@ -163,26 +233,27 @@ def validate_map_compatibility(map_paths: List[Path]) -> Dict[str, Any]:
             'errors': ['No map paths provided']
         }
     
-    # Load all map metadata
-    maps_info = []
+    # Load all map metadata, collecting sqr/cell_size/pz_version in one pass
+    sqr_values = set()
+    cell_size_values = set()
+    version_values = set()
     for map_path in map_paths:
         info = read_map_info(map_path)
-        maps_info.append({'name': map_path.name, 'info': info})
+        sqr_values.add(info['sqr'])
+        cell_size_values.add(info['cell_size'])
+        version_values.add(info['pz_version'])
     
     # Check sqr values
-    sqr_values = set(m['info']['sqr'] for m in maps_info)
     sqr_compatible = len(sqr_values) == 1
-    sqr = list(sqr_values)[0] if sqr_compatible else None
+    sqr = next(iter(sqr_values)) if sqr_compatible else None
     
     # Check cell_size values
-    cell_size_values = set(m['info']['cell_size'] for m in maps_info)
     cell_size_compatible = len(cell_size_values) == 1
-    cell_size = list(cell_size_values)[0] if cell_size_compatible else None
+    cell_size = next(iter(cell_size_values)) if cell_size_compatible else None
     
     # Check pz_version values
-    version_values = set(m['info']['pz_version'] for m in maps_info)
     version_compatible = len(version_values) == 1
-    pz_version = list(version_values)[0] if version_compatible else None
+    pz_version = next(iter(version_values)) if version_compatible else None
     
     # Build warnings and errors
     warnings = []
@@ -210,3 +281,47 @@ def validate_map_compatibility(map_paths: List[Path]) -> Dict[str, Any]:
         'warnings': warnings,
         'errors': errors
     }
+
+
+def validate_map_compatibility_fast(map_paths: List[Path]) -> bool:
+    """
+    Quick yes/no compatibility check for preflight use.
+    
+    Performs the same sqr and cell_size checks as validate_map_compatibility(),
+    but stops reading map_info.json files at the first mismatch. Differing
+    pz_version values are only logged, matching how the full check treats
+    them as warnings.
+    
+    Args:
+        map_paths: List of paths to map directories
+        
+    Returns:
+        True if the maps can be stitched together, False otherwise
+        
+    Raises:
+        FileNotFoundError: If map_info.json not found
+    """
+    if not map_paths:
+        return False
+    
+    first_sqr = first_cell_size = first_version = None
+    
+    for idx, map_path in enumerate(map_paths):
+        info = read_map_info(map_path)
+        
+        if idx == 0:
+            first_sqr = info['sqr']
+            first_cell_size = info['cell_size']
+            first_version = info['pz_version']
+            continue
+        
+        if info['sqr'] != first_sqr or info['cell_size'] != first_cell_size:
+            return False
+        
+        if info['pz_version'] != first_version:
+            logger.warning(
+                f"Maps have different PZ versions: {first_version} vs "
+                f"{info['pz_version']} ({map_path.name})"
+            )
+    
+    return True
@@ -11,6 +11,7 @@ import logging
 
 from .map_info import read_map_info
 from .dzi_parser import parse_dzi
+from .tile_loader import PACK_INDEX_SUFFIX
 
 logger = logging.getLogger(__name__)
 
@@ -168,6 +169,12 @@ def analyze_map(map_path: Union[str, Path]) -> Dict[str, Any]:
         for item in layer_folder.iterdir():
             if item.is_dir() and item.name.isdigit():
                 levels.append(int(item.name))
+            elif item.name.endswith(PACK_INDEX_SUFFIX):
+                # Packed level (see tile_loader.pack_level()), possibly
+                # with its directory removed
+                level_name = item.name[:-len(PACK_INDEX_SUFFIX)]
+                if level_name.isdigit():
+                    levels.append(int(level_name))
     
     if not levels:
         raise ValueError(
@@ -175,7 +182,7 @@ def analyze_map(map_path: Union[str, Path]) -> Dict[str, Any]:
             f"Expected to find 0/, 1/, 2/, etc."
         )
     
-    levels.sort()
+    levels = sorted(set(levels))  # A level may be both a directory and packed
     
     # Parse first .dzi file for tile size and format
     dzi_path = map_path / f"layer{layers[0]}.dzi"
@@ -229,24 +236,23 @@ def get_map_summary(maps: Dict[str, Dict[str, Any]]) -> str:
     """
     lines = [f"Found {len(maps)} map{'s' if len(maps) != 1 else ''}:"]
     
+    # discover_maps() returns maps in discovery order, so sorting is still needed
     for name, info in sorted(maps.items()):
-        dims = f"{info['width']}×{info['height']} px"
-        layer_count = len(info['layers'])
-        level_range = f"{info['min_level']}-{info['max_level']}"
-        
-        line = f"  {name}: {dims}, {layer_count} layers, levels {level_range}"
-        
         # Add notes for non-standard configs
         notes = []
         if info['skip'] > 0:
             notes.append(f"skip={info['skip']}")
         if info['sqr'] != 1:
             notes.append(f"sqr={info['sqr']}")
-        
-        if notes:
-            line += f" ({', '.join(notes)})"
-        
-        lines.append(line)
+
+        note_str = f" ({', '.join(notes)})" if notes else ""
+
+        # Build each line in a single f-string (no intermediate concatenation)
+        lines.append(
+            f"  {name}: {info['width']}×{info['height']} px, "
+            f"{len(info['layers'])} layers, "
+            f"levels {info['min_level']}-{info['max_level']}{note_str}"
+        )
     
     return '\n'.join(lines)
 
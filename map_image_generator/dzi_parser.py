@@ -6,6 +6,7 @@ DZI format: http://schemas.microsoft.com/deepzoom/2008
 """
 
 import xml.etree.ElementTree as ET
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Union
 
@@ -37,9 +38,23 @@ def parse_dzi(dzi_path: Union[str, Path]) -> Dict[str, Union[int, str]]:
     """
     dzi_path = Path(dzi_path)
     
-    if not dzi_path.exists():
+    try:
+        mtime_ns = dzi_path.stat().st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(f"DZI file not found: {dzi_path}")
     
+    # Return a copy so callers can't modify the cached result
+    return dict(_parse_dzi_cached(str(dzi_path), mtime_ns))
+
+
+@lru_cache(maxsize=256)
+def _parse_dzi_cached(dzi_path: str, mtime_ns: int) -> Dict[str, Union[int, str]]:
+    """
+    Parse a .dzi file, cached per (path, modification time).
+    
+    Including the mtime in the cache key means an edited .dzi file is
+    re-parsed instead of returning stale metadata.
+    """
     try:
         tree = ET.parse(dzi_path)
         root = tree.getroot()
@@ -112,10 +127,15 @@ def get_tiles_folder(dzi_path: Union[str, Path]) -> Path:
         >>> print(folder)
         layer0_files
     """
+    return _tiles_folder_cached(str(dzi_path))
+
+
+@lru_cache(maxsize=512)
+def _tiles_folder_cached(dzi_path: str) -> Path:
+    """Compose the tiles folder path once per .dzi path string."""
     dzi_path = Path(dzi_path)
     stem = dzi_path.stem  # "layer0" from "layer0.dzi"
-    tiles_folder = dzi_path.parent / f"{stem}_files"
-    return tiles_folder
+    return dzi_path.parent / f"{stem}_files"
 
 
 def validate_dzi(dzi_path: Union[str, Path]) -> bool:
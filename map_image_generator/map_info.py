@@ -89,6 +89,9 @@ def read_map_info(map_path: Union[str, Path]) -> Dict[str, Any]:
     numeric_fields = ['w', 'h', 'x0', 'y0', 'cell_size', 'skip', 'sqr']
     for field in numeric_fields:
         if field in info:
+            # json.load() already yields ints for well-formed files - skip those
+            if type(info[field]) is int:
+                continue
             try:
                 info[field] = int(info[field])
             except (ValueError, TypeError):
@@ -142,8 +145,17 @@ def validate_maps_consistency(maps: Dict[str, Dict[str, Any]]) -> bool:
     if not maps:
         raise ValueError("No maps provided for consistency check")
     
+    # Collect everything needed for the checks in a single pass
+    sqr_values = set()
+    cell_sizes = set()
+    b42_name = None
+    for name, info in maps.items():
+        sqr_values.add(info['sqr'])
+        cell_sizes.add(info['cell_size'])
+        if b42_name is None and info.get('pz_version', 'unknown') == 'B42':
+            b42_name = name
+    
     # Check sqr consistency
-    sqr_values = {info['sqr'] for info in maps.values()}
     if len(sqr_values) > 1:
         details = '\n'.join(f"  {name}: sqr={info['sqr']}" for name, info in maps.items())
         raise ValueError(
@@ -152,7 +164,6 @@ def validate_maps_consistency(maps: Dict[str, Dict[str, Any]]) -> bool:
         )
     
     # Check cell_size consistency
-    cell_sizes = {info['cell_size'] for info in maps.values()}
     if len(cell_sizes) > 1:
         details = '\n'.join(f"  {name}: cell_size={info['cell_size']}" for name, info in maps.items())
         raise ValueError(
@@ -161,13 +172,11 @@ def validate_maps_consistency(maps: Dict[str, Dict[str, Any]]) -> bool:
         )
     
     # Check Build 41 only (no B42)
-    for name, info in maps.items():
-        pz_version = info.get('pz_version', 'unknown')
-        if pz_version == 'B42':
-            raise ValueError(
-                f"Map '{name}' is Build 42. This tool only supports Build 41.\n"
-                f"Build 42 uses different layer structure (layer-1 to layer8 instead of layer0 to layer7)"
-            )
+    if b42_name is not None:
+        raise ValueError(
+            f"Map '{b42_name}' is Build 42. This tool only supports Build 41.\n"
+            f"Build 42 uses different layer structure (layer-1 to layer8 instead of layer0 to layer7)"
+        )
     
     return True
 
@@ -8,26 +8,29 @@ is HALF the resolution of the level above it, stopping at 1x1 pixel.
 """
 
 import math
-from typing import List, Tuple, Dict, Any
+from functools import lru_cache
+from typing import Sequence, Tuple, Dict, Any
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def build_pyramid(width: int, height: int) -> List[Tuple[int, int]]:
+@lru_cache(maxsize=256)
+def build_pyramid(width: int, height: int) -> Tuple[Tuple[int, int], ...]:
     """
     Build a complete DZI pyramid from full resolution down to 1x1 pixel.
     
     The pyramid is built by repeatedly halving dimensions (rounding up)
     until reaching 1x1 pixel. Level 0 is always 1x1, and the max level
-    is the original dimensions.
+    is the original dimensions. Results are cached, so the returned tuple
+    is shared between callers.
     
     Args:
         width: Full resolution width in pixels (must be positive)
         height: Full resolution height in pixels (must be positive)
         
     Returns:
-        List of (width, height) tuples, indexed by level.
+        Tuple of (width, height) tuples, indexed by level.
         Level 0 is (1, 1), max level is (width, height).
         
     Raises:
@@ -44,34 +47,31 @@ def build_pyramid(width: int, height: int) -> List[Tuple[int, int]]:
         >>> pyramid[9]   # Level 9
         (310, 249)
     """
-    if width <= 0 or height <= 0:
-        raise ValueError(
-            f"Invalid dimensions for pyramid: {width}x{height}\n"
-            f"Width and height must be positive integers"
-        )
+    num_levels = calculate_num_levels(width, height)
     
-    # Build pyramid from top (full size) down to (1, 1)
-    pyramid = [(width, height)]
+    # Fill from the top (full size) level down to level 0 (1x1), so the
+    # list never grows and needs no reversing
+    pyramid = [None] * num_levels
+    w, h = width, height
+    pyramid[-1] = (w, h)
     
-    while pyramid[-1] != (1, 1):
-        w, h = pyramid[-1]
-        # Half size, rounding up (ensures we reach 1x1 eventually)
+    for level in range(num_levels - 2, -1, -1):
+        # Half size, rounding up (reaches 1x1 exactly at level 0)
         w = (w + 1) // 2
         h = (h + 1) // 2
-        pyramid.append((w, h))
-    
-    # Reverse so level 0 is smallest (1x1)
-    pyramid.reverse()
+        pyramid[level] = (w, h)
     
-    return pyramid
+    return tuple(pyramid)
 
 
+@lru_cache(maxsize=256)
 def calculate_num_levels(width: int, height: int) -> int:
     """
     Calculate the number of levels in a DZI pyramid.
     
-    This is approximately log₂(max(width, height)) + 1, but the exact
-    value depends on the rounding behavior of the pyramid algorithm.
+    Computed in closed form without building the pyramid: halving with
+    rounding up takes a dimension n down to 1 in exactly ceil(log₂(n))
+    steps, which is (n - 1).bit_length().
     
     Args:
         width: Full resolution width in pixels
@@ -80,6 +80,9 @@ def calculate_num_levels(width: int, height: int) -> int:
     Returns:
         Number of levels (including level 0)
         
+    Raises:
+        ValueError: If width or height are not positive
+        
     Example:
         >>> calculate_num_levels(19800, 15900)
         16
@@ -88,9 +91,11 @@ def calculate_num_levels(width: int, height: int) -> int:
         >>> calculate_num_levels(1200, 1200)
         12
     """
-    return len(build_pyramid(width, height))
+    _check_dimensions(width, height)
+    return (max(width, height) - 1).bit_length() + 1
 
 
+@lru_cache(maxsize=256)
 def get_max_level(width: int, height: int) -> int:
     """
     Get the maximum (highest zoom) level index for given dimensions.
@@ -165,7 +170,7 @@ def get_pyramid_info(
         
     Returns:
         Dictionary with keys:
-            - pyramid: List of (width, height) for each level
+            - pyramid: Tuple of (width, height) for each level
             - num_levels: Total number of levels
             - max_level: Highest level index (accounting for skip)
             - min_level: Lowest level available (= skip)
@@ -173,7 +178,8 @@ def get_pyramid_info(
             - total_tiles: Total number of tiles across all available levels
             
     Raises:
-        ValueError: If skip is negative or >= num_levels
+        ValueError: If skip is negative or >= num_levels, or tile_size
+            is not positive
         
     Example:
         >>> info = get_pyramid_info(19800, 15900, 300, skip=0)
@@ -189,8 +195,7 @@ def get_pyramid_info(
     if skip < 0:
         raise ValueError(f"skip must be non-negative, got {skip}")
     
-    pyramid = build_pyramid(width, height)
-    num_levels = len(pyramid)
+    num_levels = calculate_num_levels(width, height)
     
     if skip >= num_levels:
         raise ValueError(
@@ -198,13 +203,20 @@ def get_pyramid_info(
             f"Cannot skip more levels than exist in the pyramid"
         )
     
-    # Calculate tiles for each level
+    if tile_size <= 0:
+        raise ValueError(f"tile_size must be positive, got {tile_size}")
+    
+    pyramid = build_pyramid(width, height)
+    
+    # Calculate tiles for each level in one pass over the cached pyramid
+    # (tile_size validated once above, so the ceil division is inlined)
     tiles_per_level = {}
     total_tiles = 0
     
     for level in range(skip, num_levels):
         w, h = pyramid[level]
-        cols, rows = calculate_tiles_for_level(w, h, tile_size)
+        cols = (w + tile_size - 1) // tile_size
+        rows = (h + tile_size - 1) // tile_size
         tiles_per_level[level] = (cols, rows)
         total_tiles += cols * rows
     
@@ -225,7 +237,16 @@ def get_pyramid_info(
     }
 
 
-def validate_pyramid_consistency(pyramids: Dict[str, List[Tuple[int, int]]]) -> bool:
+def _check_dimensions(width: int, height: int):
+    """Raise ValueError unless both pyramid dimensions are positive."""
+    if width <= 0 or height <= 0:
+        raise ValueError(
+            f"Invalid dimensions for pyramid: {width}x{height}\n"
+            f"Width and height must be positive integers"
+        )
+
+
+def validate_pyramid_consistency(pyramids: Dict[str, Sequence[Tuple[int, int]]]) -> bool:
     """
     Validate that multiple pyramids have the same number of levels.
     
@@ -233,7 +254,7 @@ def validate_pyramid_consistency(pyramids: Dict[str, List[Tuple[int, int]]]) ->
     must all have the same pyramid structure to align properly.
     
     Args:
-        pyramids: Dictionary of {map_name: pyramid_list}
+        pyramids: Dictionary of {map_name: pyramid} (from build_pyramid())
         
     Returns:
         True if all pyramids have same number of levels
@@ -9,13 +9,22 @@ This is a streamlined version with all the lessons learned:
 """
 
 from pathlib import Path
-from typing import Union, List
+from typing import Union, List, Optional
 from PIL import Image
 from .dzi_parser import parse_dzi
 from .pyramid import build_pyramid, get_max_level
-from .tile_loader import load_tiles_for_level, get_tile_bounds
-from .bounds import calculate_global_bounds, validate_map_compatibility
+from .tile_loader import scan_tiles_for_level, iter_tile_images, _iter_decoded_tiles, get_tile_bounds
+from .bounds import (
+    calculate_global_bounds_packed, validate_map_compatibility, validate_map_compatibility_fast
+)
 from .map_info import read_map_info
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Default PNG zlib level: fastest compression. Saving dominates the run time
+# of large stitches, and higher levels cost far more time than they save space.
+PNG_COMPRESS_LEVEL = 1
 
 
 def stitch_single_map(
@@ -23,7 +32,9 @@ def stitch_single_map(
     layer: int,
     level: int,
     output_path: Union[str, Path],
-    format: str = None
+    format: str = None,
+    compress_level: int = PNG_COMPRESS_LEVEL,
+    high_compression: bool = False
 ) -> Path:
     """
     Stitch all tiles for a single map layer at a specific zoom level.
@@ -34,6 +45,8 @@ def stitch_single_map(
         level: Zoom level (0 = smallest, max_level = full resolution)
         output_path: Where to save the stitched image
         format: Output format ('PNG', 'JPEG', 'WEBP'). Auto-detected if None.
+        compress_level: PNG zlib level (0-9); the default favours speed
+        high_compression: PNG only - smallest file, much slower save
         
     Returns:
         Path to the saved output file
@@ -60,44 +73,40 @@ def stitch_single_map(
         raise ValueError(f"Invalid level {level}. Must be 0-{max_level}")
     
     level_width, level_height = pyramid[level]
-    print(f"Stitching {map_path.name}, layer {layer}, level {level}")
-    print(f"  Dimensions: {level_width}×{level_height} pixels")
+    logger.info(f"Stitching {map_path.name}, layer {layer}, level {level}")
+    logger.info(f"  Dimensions: {level_width}×{level_height} pixels")
     
-    # Load tiles
-    tiles = load_tiles_for_level(map_path, layer, level)
+    # Find tiles (no decoding yet - tiles are streamed onto the canvas below)
+    tiles = scan_tiles_for_level(map_path, layer, level)
     if not tiles:
         raise ValueError(f"No tiles found for layer {layer}, level {level}")
     
-    print(f"  Found {len(tiles)} tiles")
+    logger.info(f"  Found {len(tiles)} tiles")
     
     # Get tile bounds (tiles don't start at 0!)
     bounds = get_tile_bounds(tiles)
-    print(f"  Tile grid: ({bounds['min_x']},{bounds['min_y']}) to ({bounds['max_x']},{bounds['max_y']})")
+    logger.info(f"  Tile grid: ({bounds['min_x']},{bounds['min_y']}) to ({bounds['max_x']},{bounds['max_y']})")
     
     # Calculate output dimensions
-    # Get rightmost and bottommost tile actual sizes (edge tiles may be smaller)
-    rightmost = [t for t in tiles if t['x'] == bounds['max_x']]
-    bottommost = [t for t in tiles if t['y'] == bounds['max_y']]
+    # Rightmost and bottommost tiles may be smaller (bounds has their actual sizes)
+    output_width = bounds['min_x'] * tile_size + (bounds['cols'] - 1) * tile_size + bounds['rightmost_width']
+    output_height = bounds['min_y'] * tile_size + (bounds['rows'] - 1) * tile_size + bounds['bottommost_height']
     
-    rightmost_width = max(t['image'].size[0] for t in rightmost)
-    bottommost_height = max(t['image'].size[1] for t in bottommost)
-    
-    output_width = bounds['min_x'] * tile_size + (bounds['cols'] - 1) * tile_size + rightmost_width
-    output_height = bounds['min_y'] * tile_size + (bounds['rows'] - 1) * tile_size + bottommost_height
-    
-    print(f"  Output: {output_width}×{output_height} pixels")
+    logger.info(f"  Output: {output_width}×{output_height} pixels")
     
     # Create canvas and paste tiles
+    # Tiles of one level never overlap and the canvas starts fully transparent,
+    # so "over" compositing reduces to a plain copy - no blending needed
     output_image = Image.new('RGBA', (output_width, output_height), (0, 0, 0, 0))
     
-    for tile in tiles:
+    for tile, tile_img in iter_tile_images(tiles):
         pixel_x = tile['x'] * tile_size
         pixel_y = tile['y'] * tile_size
-        output_image.alpha_composite(tile['image'], (pixel_x, pixel_y))
+        output_image.paste(tile_img, (pixel_x, pixel_y))
     
     # Save
-    _save_image(output_image, output_path, format)
-    print(f"✓ Saved to {output_path}")
+    _save_image(output_image, output_path, format, compress_level, high_compression)
+    logger.info(f"✓ Saved to {output_path}")
     
     return output_path
 
@@ -108,7 +117,9 @@ def stitch_multi_map(
     level: int,
     output_path: Union[str, Path],
     format: str = None,
-    map_order: List[int] = None
+    map_order: List[int] = None,
+    compress_level: int = PNG_COMPRESS_LEVEL,
+    high_compression: bool = False
 ) -> Path:
     """
     Stitch multiple maps together into a single image.
@@ -123,6 +134,8 @@ def stitch_multi_map(
         format: Output format ('PNG', 'JPEG', 'WEBP'). Auto-detected if None.
         map_order: List of indices specifying stitch order (e.g., [1, 0, 2]).
                    If None, auto-orders: base map first, then others.
+        compress_level: PNG zlib level (0-9); the default favours speed
+        high_compression: PNG only - smallest file, much slower save
         
     Returns:
         Path to the saved output file
@@ -156,22 +169,24 @@ def stitch_multi_map(
         if not map_path.exists():
             raise FileNotFoundError(f"Map folder not found: {map_path}")
     
-    # Validate compatibility
-    print("Validating maps...")
-    compat = validate_map_compatibility(map_paths)
-    if not compat['compatible']:
+    # Validate compatibility: the quick check stops at the first mismatch,
+    # and the full check only runs to explain a failure
+    logger.info("Validating maps...")
+    if not validate_map_compatibility_fast(map_paths):
+        compat = validate_map_compatibility(map_paths)
         raise ValueError("Maps incompatible:\n" + "\n".join(f"  {e}" for e in compat['errors']))
     
-    print(f"✓ Compatible (sqr={compat['sqr']}, cell_size={compat['cell_size']})")
+    logger.info("✓ Compatible")
     
-    # Calculate global bounds
-    print("\nCalculating bounds...")
-    bounds = calculate_global_bounds(map_paths, layer)
-    print(f"✓ Global: ({bounds['min_x']},{bounds['min_y']}) to ({bounds['max_x']},{bounds['max_y']})")
-    print(f"  Area: {bounds['width']}×{bounds['height']} pixels")
+    # Calculate global bounds (only the extents are needed, so skip the
+    # per-map dicts)
+    logger.info("Calculating bounds...")
+    bounds = calculate_global_bounds_packed(map_paths, layer)
+    logger.info(f"✓ Global: ({bounds['min_x']},{bounds['min_y']}) to ({bounds['max_x']},{bounds['max_y']})")
+    logger.info(f"  Area: {bounds['width']}×{bounds['height']} pixels")
     
     # Determine zoom levels for each map
-    print(f"\nDetermining zoom levels...")
+    logger.info(f"Determining zoom levels...")
     map_levels = _calculate_map_levels(map_paths, layer, level)
     
     # Calculate canvas size at target zoom
@@ -179,16 +194,19 @@ def stitch_multi_map(
     canvas_width = int(bounds['width'] * scale_factor)
     canvas_height = int(bounds['height'] * scale_factor)
     
-    print(f"  Zoom out: {map_levels['zoom_out']} levels from max {map_levels['highest_max']}")
-    print(f"  Canvas: {canvas_width}×{canvas_height} pixels")
+    logger.info(f"  Zoom out: {map_levels['zoom_out']} levels from max {map_levels['highest_max']}")
+    logger.info(f"  Canvas: {canvas_width}×{canvas_height} pixels")
     
     # Create canvas
     output_image = Image.new('RGBA', (canvas_width, canvas_height), (0, 0, 0, 0))
     
     # Stitch each map
-    print(f"\nStitching {len(map_paths)} maps...")
+    # painted_rects tracks what earlier maps covered, so tiles landing on
+    # untouched canvas can be copied instead of blended
+    painted_rects = []
+    logger.info(f"Stitching {len(map_paths)} maps...")
     for idx, map_path in enumerate(map_paths, 1):
-        print(f"\n[{idx}/{len(map_paths)}] {map_path.name}")
+        logger.info(f"[{idx}/{len(map_paths)}] {map_path.name}")
         
         _stitch_map_onto_canvas(
             output_image=output_image,
@@ -196,13 +214,14 @@ def stitch_multi_map(
             layer=layer,
             map_levels=map_levels,
             bounds=bounds,
-            scale_factor=scale_factor
+            scale_factor=scale_factor,
+            painted_rects=painted_rects
         )
     
     # Save
-    _save_image(output_image, output_path, format)
-    print(f"\n✓ Complete! Saved to {output_path}")
-    print(f"  Size: {canvas_width}×{canvas_height} pixels")
+    _save_image(output_image, output_path, format, compress_level, high_compression)
+    logger.info(f"✓ Complete! Saved to {output_path}")
+    logger.info(f"  Size: {canvas_width}×{canvas_height} pixels")
     
     return output_path
 
@@ -218,31 +237,41 @@ def _calculate_map_levels(map_paths: List[Path], layer: int, requested_level: in
     
     Returns dict with 'highest_max', 'zoom_out', 'scale_factor', and per-map levels.
     """
+    if not map_paths:
+        raise ValueError("No map paths provided")
+    
+    # Single pass over the maps: all file reads happen here
     map_info = {}
-    max_levels = []
+    highest_max = 0
     
     for map_path in map_paths:
         dzi_file = map_path / f"layer{layer}.dzi"
         dzi_info = parse_dzi(dzi_file)
         max_level = get_max_level(dzi_info['width'], dzi_info['height'])
         
+        # Levels below 'skip' are not generated
+        min_level = read_map_info(map_path).get('skip', 0)
+        
         map_info[map_path] = {
             'max_level': max_level,
+            'min_level': min_level,
             'dzi_info': dzi_info
         }
-        max_levels.append(max_level)
+        if max_level > highest_max:
+            highest_max = max_level
     
-    highest_max = max(max_levels)
     zoom_out = highest_max - requested_level
     
     if zoom_out < 0:
         raise ValueError(f"Requested level {requested_level} > highest available {highest_max}")
     
-    # Calculate actual level for each map
+    # Calculate actual level for each map (needs highest_max, so not foldable
+    # into the loop above). Maps that bottom out use their lowest available
+    # level and get downscaled while compositing.
     for map_path, info in map_info.items():
-        actual_level = max(0, info['max_level'] - zoom_out)
+        actual_level = max(info['min_level'], info['max_level'] - zoom_out)
         info['actual_level'] = actual_level
-        print(f"  {map_path.name}: level {actual_level} (max {info['max_level']})")
+        logger.info(f"  {map_path.name}: level {actual_level} (max {info['max_level']})")
     
     return {
         'highest_max': highest_max,
@@ -258,31 +287,38 @@ def _stitch_map_onto_canvas(
     layer: int,
     map_levels: dict,
     bounds: dict,
-    scale_factor: float
+    scale_factor: float,
+    painted_rects: Optional[List[tuple]] = None
 ):
     """
     Load tiles from one map and composite them onto the output canvas.
     
     Algorithm:
-    1. Load tiles at appropriate level for this map
+    1. Find tiles at appropriate level for this map
     2. Get world position (negate x0/y0 from map_info.json)
-    3. For each tile:
+    3. For each tile (decoded one at a time to keep memory flat):
        - Calculate position in full-resolution world coordinates
        - Scale to canvas coordinates
        - Paste with alpha compositing
+    
+    If painted_rects is given, it must list every canvas area (left, top,
+    right, bottom) drawn so far; the rest of the canvas is assumed to be
+    transparent. Tiles outside those areas are copied without blending, and
+    the area covered by this map is appended when done. With None, every
+    tile is alpha-composited.
     """
     info = map_levels['map_info'][map_path]
     actual_level = info['actual_level']
     max_level = info['max_level']
     tile_size = info['dzi_info']['tile_size']
     
-    # Load tiles
-    tiles = load_tiles_for_level(map_path, layer, actual_level)
+    # Find tiles
+    tiles = scan_tiles_for_level(map_path, layer, actual_level)
     if not tiles:
-        print(f"  No tiles found, skipping")
+        logger.info(f"  No tiles found, skipping")
         return
     
-    print(f"  Loaded {len(tiles)} tiles from level {actual_level}")
+    logger.info(f"  Found {len(tiles)} tiles at level {actual_level}")
     
     # Get world position (x0/y0 are NEGATIVE world coords)
     map_info_data = read_map_info(map_path)
@@ -292,47 +328,175 @@ def _stitch_map_onto_canvas(
     # Scale factor to convert tile level to full resolution
     level_scale_up = 2 ** (max_level - actual_level)
     
+    # Per-map constants, hoisted out of the per-tile loop
+    # (both scale factors are powers of two, so regrouping is exact)
+    origin_x = world_x - bounds['min_x']  # Map origin relative to global bounds
+    origin_y = world_y - bounds['min_y']
+    tile_step = tile_size * level_scale_up  # Full-resolution pixels per tile
+    size_scale = level_scale_up * scale_factor  # Tile pixels -> canvas pixels
+    canvas_size = output_image.size
+    
+    # Common case: the map's tiles are at canvas resolution and its origin
+    # lands on a whole canvas pixel. Tiles then sit on an integer grid and
+    # never need resizing, so the per-tile float math can be skipped.
+    # (scale_factor is a power of two, so these products are exact.)
+    base_x = origin_x * scale_factor
+    base_y = origin_y * scale_factor
+    exact_grid = size_scale == 1 and base_x.is_integer() and base_y.is_integer()
+    base_x = int(base_x)
+    base_y = int(base_y)
+    
     # Composite tiles
     pasted = 0
-    for tile in tiles:
-        # Calculate position in full-resolution world coordinates
-        tile_full_x = world_x + (tile['x'] * tile_size * level_scale_up)
-        tile_full_y = world_y + (tile['y'] * tile_size * level_scale_up)
-        
-        # Convert to canvas coordinates
-        canvas_x = int(round((tile_full_x - bounds['min_x']) * scale_factor))
-        canvas_y = int(round((tile_full_y - bounds['min_y']) * scale_factor))
+    empty = 0
+    drawn_box = None  # Union of all tile boxes drawn for this map
+    for tile, tile_img, alpha_range in _iter_decoded_tiles(tiles):
+        if exact_grid:
+            canvas_x = base_x + tile['x'] * tile_size
+            canvas_y = base_y + tile['y'] * tile_size
+            resized = False
+        else:
+            # Full-resolution position relative to global bounds, scaled to canvas
+            canvas_x = int(round((origin_x + tile['x'] * tile_step) * scale_factor))
+            canvas_y = int(round((origin_y + tile['y'] * tile_step) * scale_factor))
+            
+            # Calculate expected tile size on canvas
+            canvas_w = int(round(tile_img.size[0] * size_scale))
+            canvas_h = int(round(tile_img.size[1] * size_scale))
+            
+            # Resize if needed (only when the map's pyramid bottoms out before the
+            # requested zoom). Pyramid tiles are already smoothed, so bilinear is
+            # enough and much cheaper than Lanczos.
+            resized = tile_img.size != (canvas_w, canvas_h)
+            if resized:
+                tile_img = tile_img.resize((max(1, canvas_w), max(1, canvas_h)), Image.BILINEAR)
         
-        # Calculate expected tile size on canvas
-        tile_full_w = tile['image'].size[0] * level_scale_up
-        tile_full_h = tile['image'].size[1] * level_scale_up
-        canvas_w = int(round(tile_full_w * scale_factor))
-        canvas_h = int(round(tile_full_h * scale_factor))
+        # Clip to the canvas (skip if entirely outside) so off-canvas pixels of
+        # edge tiles are never probed or blended
+        clip_box = _clip_to_canvas(canvas_x, canvas_y, tile_img.size, canvas_size)
+        if clip_box is None:
+            continue
+        if clip_box != (0, 0) + tile_img.size:
+            tile_img = tile_img.crop(clip_box)
         
-        # Resize if needed (usually not necessary when levels align properly)
-        tile_img = tile['image']
-        if tile_img.size != (canvas_w, canvas_h):
-            tile_img = tile_img.resize((max(1, canvas_w), max(1, canvas_h)), Image.LANCZOS)
+        position = (canvas_x + clip_box[0], canvas_y + clip_box[1])
+        tile_box = (position[0], position[1],
+                    position[0] + tile_img.size[0], position[1] + tile_img.size[1])
         
-        # Paste (skip if outside canvas)
-        if _is_within_canvas(canvas_x, canvas_y, tile_img.size, output_image.size):
-            output_image.alpha_composite(tile_img, (canvas_x, canvas_y))
+        # Nothing drawn underneath yet: "over" a transparent canvas is a plain copy.
+        # Resized tiles may overlap their neighbours by a rounding pixel, so
+        # they always go through normal compositing.
+        if (painted_rects is not None and not resized
+                and not any(_boxes_overlap(tile_box, r) for r in painted_rects)):
+            output_image.paste(tile_img, position)
             pasted += 1
+        elif _composite_tile(output_image, tile_img, position, alpha_range):
+            pasted += 1
+        else:
+            empty += 1
+        
+        if drawn_box is None:
+            drawn_box = tile_box
+        else:
+            drawn_box = (min(drawn_box[0], tile_box[0]), min(drawn_box[1], tile_box[1]),
+                         max(drawn_box[2], tile_box[2]), max(drawn_box[3], tile_box[3]))
+    
+    if painted_rects is not None and drawn_box is not None:
+        painted_rects.append(drawn_box)
     
-    print(f"  Pasted {pasted} tiles")
+    logger.info(f"  Pasted {pasted} tiles" + (f" ({empty} empty skipped)" if empty else ""))
 
 
-def _is_within_canvas(x: int, y: int, tile_size: tuple, canvas_size: tuple) -> bool:
-    """Check if tile position is at least partially within canvas bounds."""
-    if x >= canvas_size[0] or y >= canvas_size[1]:
-        return False
-    if x + tile_size[0] <= 0 or y + tile_size[1] <= 0:
+def _boxes_overlap(a: tuple, b: tuple) -> bool:
+    """Check if two (left, top, right, bottom) boxes share any pixels."""
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def _composite_tile(
+    output_image: Image.Image,
+    tile_img: Image.Image,
+    position: tuple,
+    alpha_range: Optional[tuple] = None
+) -> bool:
+    """
+    Composite one tile onto the canvas.
+    
+    Fully transparent tiles (common in sparse mod overlays) would not change
+    the canvas and are skipped. Fully opaque tiles (typical for layer 0
+    terrain) completely replace the pixels underneath, so they are copied
+    with paste() instead of paying for a full alpha blend per pixel.
+    Tiles without an alpha band are opaque by definition and are pasted
+    without inspecting them.
+    
+    Args:
+        output_image: RGBA canvas to draw on
+        tile_img: Tile image (possibly resized or cropped from the decoded tile)
+        position: (x, y) on the canvas
+        alpha_range: (min, max) alpha of the decoded tile, as measured by the
+                     tile loader; probed from tile_img if None. Resizing and
+                     cropping keep alpha within this range, so it stays valid.
+    
+    Returns:
+        True if the tile was drawn, False if it was skipped as empty
+    """
+    if tile_img.mode != 'RGBA':
+        # paste() widens RGB/L to the canvas mode with alpha = 255
+        output_image.paste(tile_img, position)
+        return True
+    
+    if alpha_range is None:
+        # Scanning only the alpha band is ~3x cheaper than getextrema() on RGBA
+        alpha_range = tile_img.getchannel('A').getextrema()
+    alpha_min, alpha_max = alpha_range
+    if alpha_max == 0:
         return False
+    
+    if alpha_min == 255:
+        output_image.paste(tile_img, position)
+    else:
+        output_image.alpha_composite(tile_img, position)
     return True
 
 
-def _save_image(image: Image.Image, output_path: Path, format: str = None):
-    """Save image with format-specific options."""
+def _clip_to_canvas(x: int, y: int, tile_size: tuple, canvas_size: tuple) -> Optional[tuple]:
+    """
+    Get the part of a tile placed at (x, y) that lies within the canvas.
+    
+    Returns:
+        Crop box (left, upper, right, lower) in tile coordinates,
+        or None if the tile is entirely outside the canvas
+    """
+    left = max(0, -x)
+    upper = max(0, -y)
+    right = min(tile_size[0], canvas_size[0] - x)
+    lower = min(tile_size[1], canvas_size[1] - y)
+    
+    if left >= right or upper >= lower:
+        return None
+    return (left, upper, right, lower)
+
+
+def _save_image(
+    image: Image.Image,
+    output_path: Path,
+    format: str = None,
+    compress_level: int = PNG_COMPRESS_LEVEL,
+    high_compression: bool = False
+):
+    """
+    Save image with format-specific options.
+    
+    PNG defaults to fast zlib compression: for large maps Pillow's
+    optimize pass costs several times the encode time for a small size
+    gain. Pass high_compression=True when file size matters more.
+    
+    Args:
+        image: Image to save
+        output_path: Destination file
+        format: Output format ('PNG', 'JPEG', 'WEBP'). Auto-detected if None.
+        compress_level: PNG zlib level (0-9)
+        high_compression: PNG only - use Pillow's optimize pass (smallest, slowest)
+    """
     # Auto-detect format from extension
     if format is None:
         format = output_path.suffix.upper().lstrip('.')
@@ -353,12 +517,15 @@ def _save_image(image: Image.Image, output_path: Path, format: str = None):
         # Convert RGBA to RGB with white background
         if image.mode == 'RGBA':
             background = Image.new('RGB', image.size, (255, 255, 255))
-            background.paste(image, mask=image.split()[3])
+            background.paste(image, mask=image)  # Uses alpha band, no copy
             image = background
         save_kwargs = {'quality': 95, 'optimize': True}
     elif format == 'WEBP':
         save_kwargs = {'quality': 95, 'method': 6}
     elif format == 'PNG':
-        save_kwargs = {'optimize': True}
+        if high_compression:
+            save_kwargs = {'optimize': True}
+        else:
+            save_kwargs = {'compress_level': compress_level}
     
     image.save(output_path, format=format, **save_kwargs)
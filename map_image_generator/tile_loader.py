@@ -2,27 +2,85 @@
 Tile Loader
 
 Loads individual tile images from disk with proper format handling.
+
+A level's tiles can also be packed into a single file (see pack_level());
+the loaders read packed tiles transparently.
 """
 
+import io
+import json
+import mmap
+import os
 import re
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Union, Tuple, List, Dict, Any, Optional
+from typing import Union, Tuple, List, Dict, Any, Optional, Iterator
 import logging
 
-from PIL import Image
+from PIL import Image, UnidentifiedImageError
 
 logger = logging.getLogger(__name__)
 
+# Decoded tiles kept in memory between calls, so re-stitching the same
+# level skips decoding. Off by default: a single stitch decodes each tile
+# once, and cached tiles would stay alive for the rest of the process.
+# Enable with set_tile_cache_budget() (the GUI does, since it re-stitches
+# the same maps); clear_tile_cache() frees it.
+MAX_TILE_CACHE_BYTES = 0
+
+# {(path, mtime_ns, size): (Image, alpha range)}, least recently used first
+_tile_cache = OrderedDict()
+_tile_cache_bytes = 0
+_tile_cache_lock = threading.Lock()
+
+# Pillow decoder to try first for each tile extension, so Image.open()
+# doesn't probe every registered plugin
+_TILE_DECODERS = {
+    '.webp': ('WEBP',),
+    '.png': ('PNG',),
+    '.jpg': ('JPEG',),
+    '.jpeg': ('JPEG',),
+}
+
+# Packed level files, stored next to the level directory:
+# layer0_files/15.pack and layer0_files/15.pack.json
+PACK_SUFFIX = '.pack'
+PACK_INDEX_SUFFIX = '.pack.json'
+
+# Tile filename: {x}_{y}.{ext}
+_COORD_RE = re.compile(r'(\d+)_(\d+)\.\w+$')
 
-def load_tile(tile_path: Union[str, Path]) -> Image.Image:
+
+def load_tile(
+    tile_path: Union[str, Path],
+    max_size: Optional[Tuple[int, int]] = None
+) -> Image.Image:
     """
     Load a single tile image from disk.
     
     Automatically converts to RGBA mode for consistent compositing.
     Handles WebP, PNG, and JPG formats.
     
+    If the tile's level directory has been removed after packing
+    (pack_level()), the tile is read from the pack file instead.
+    
+    If MAX_TILE_CACHE_BYTES is set, decoded tiles are cached (least
+    recently used evicted first) and keyed on the file's modification
+    time, so a changed file is decoded again. The returned image may then
+    be shared with the cache: copy() it before modifying it in place.
+    
     Args:
         tile_path: Path to tile image file
+        max_size: Optional (width, height) to shrink the tile to fit within,
+                  keeping its aspect ratio. JPEG tiles are then decoded at
+                  reduced scale (1/2, 1/4 or 1/8), which is much faster and
+                  uses far less memory than a full decode.
         
     Returns:
         PIL Image in RGBA mode
@@ -36,25 +94,221 @@ def load_tile(tile_path: Union[str, Path]) -> Image.Image:
         >>> print(tile.size, tile.mode)
         (300, 249) RGBA
     """
-    tile_path = Path(tile_path)
+    return _load_tile(Path(tile_path), None, max_size)[0]
+
+
+def _load_tile(
+    tile_path: Path,
+    packed: Optional[Tuple[Path, int, int, int]],
+    max_size: Optional[Tuple[int, int]] = None
+) -> Tuple[Image.Image, Tuple[int, int]]:
+    """
+    load_tile(), reading from packed if given.
     
-    if not tile_path.exists():
-        raise FileNotFoundError(f"Tile file not found: {tile_path}")
+    packed is the tile's (pack_path, index_mtime_ns, offset, length) as
+    resolved by scan_tiles_for_level(); if None the tile file is read, and
+    the pack only looked up when that file is missing.
+    
+    Returns (image, (min_alpha, max_alpha)). The alpha range is measured
+    while decoding, so compositing needn't scan the tile again; sources
+    without transparency report (255, 255) without any scan.
+    """
+    if packed is None:
+        try:
+            stat = tile_path.stat()
+        except FileNotFoundError:
+            packed = _find_packed_tile(tile_path)
+            if packed is None:
+                raise FileNotFoundError(f"Tile file not found: {tile_path}")
+    
+    if packed is not None:
+        key = (str(tile_path),) + packed[1:]
+    else:
+        key = (str(tile_path), stat.st_mtime_ns, stat.st_size)
+    
+    if max_size is not None:
+        key += (tuple(max_size),)
+    
+    cached = _get_cached_tile(key)
+    if cached is not None:
+        return cached
     
     try:
-        with Image.open(tile_path) as img:
-            # Load image data into memory and convert to RGBA
-            # This ensures the file is closed and all tiles have alpha channel
-            if img.mode != 'RGBA':
-                img = img.convert('RGBA')
+        data = None if packed is None else _read_packed_tile(*packed)
+        with _open_tile(tile_path, data) as source:
+            if max_size is not None:
+                # Reduced-scale decode where the format supports it (JPEG);
+                # a no-op for others
+                source.draft(source.mode, tuple(max_size))
             
-            # Force load into memory before closing file
-            img.load()
+            bands = source.getbands()
+            transparent = 'A' in bands or 'a' in bands or 'transparency' in source.info
             
-            return img
+            if source.mode == 'RGBA':
+                # Already RGBA: decode in place, no conversion copy
+                source.load()
+                img = source
+            else:
+                # convert() decodes and returns a new, fully loaded image;
+                # release the decoded source right away instead of at GC
+                img = source.convert('RGBA')
+                source.close()
+        
+        if max_size is not None:
+            img.thumbnail(max_size)
+        
+        # Scanning only the alpha band is ~3x cheaper than getextrema() on RGBA
+        alpha_range = img.getchannel('A').getextrema() if transparent else (255, 255)
         
     except Exception as e:
         raise IOError(f"Failed to load tile {tile_path}: {e}")
+    
+    _cache_tile(key, (img, alpha_range))
+    return img, alpha_range
+
+
+def has_alpha(img: Image.Image) -> bool:
+    """
+    Check whether an image has any transparent pixels (scans the alpha band).
+    
+    Tiles from load_tiles_for_level() already carry this as 'has_alpha',
+    measured while decoding.
+    """
+    return 'A' in img.getbands() and img.getchannel('A').getextrema()[0] < 255
+
+
+def load_tile_header(tile_path: Union[str, Path]) -> Tuple[Tuple[int, int], str]:
+    """
+    Read a tile's size and mode without decoding its pixels.
+    
+    Only the image header is parsed, which is far cheaper than load_tile()
+    when the pixels themselves are not needed (bounds, sizes, indexing).
+    
+    Args:
+        tile_path: Path to tile image file
+        
+    Returns:
+        Tuple of ((width, height), mode) as stored in the file
+        (mode is not converted as in load_tile())
+        
+    Raises:
+        FileNotFoundError: If tile file doesn't exist
+        IOError: If the file is not a readable image
+        
+    Example:
+        >>> load_tile_header('out/html/map_data/base_top/layer0_files/15/0_16.webp')
+        ((300, 249), 'RGBA')
+    """
+    return _load_tile_header(Path(tile_path), None)
+
+
+def _load_tile_header(
+    tile_path: Path,
+    packed: Optional[Tuple[Path, int, int, int]]
+) -> Tuple[Tuple[int, int], str]:
+    """load_tile_header(), reading from packed if given (see _load_tile())."""
+    try:
+        if packed is None:
+            try:
+                with _open_tile(tile_path) as img:
+                    return img.size, img.mode
+            except FileNotFoundError:
+                packed = _find_packed_tile(tile_path)
+                if packed is None:
+                    raise
+        
+        with _open_tile(tile_path, _read_packed_tile(*packed)) as img:
+            return img.size, img.mode
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Tile file not found: {tile_path}")
+    except Exception as e:
+        raise IOError(f"Failed to read tile header {tile_path}: {e}")
+
+
+def _open_tile(tile_path: Path, data: Optional[bytes] = None) -> Image.Image:
+    """
+    Open a tile with the decoder its extension names, probing all if that fails.
+    
+    If data is given (a packed tile's bytes), it is decoded instead of the file.
+    """
+    source = tile_path if data is None else io.BytesIO(data)
+    formats = _TILE_DECODERS.get(tile_path.suffix.lower())
+    if formats is not None:
+        try:
+            return Image.open(source, formats=formats)
+        except UnidentifiedImageError:
+            pass  # Mislabelled file - let Pillow identify it
+    return Image.open(source)
+
+
+def clear_tile_cache():
+    """Drop all decoded tiles held by load_tile()'s cache, and open pack files."""
+    global _tile_cache_bytes
+    with _tile_cache_lock:
+        _tile_cache.clear()
+        _tile_cache_bytes = 0
+    _map_pack.cache_clear()
+    _read_pack_index.cache_clear()
+
+
+def set_tile_cache_budget(max_bytes: int):
+    """
+    Set how many bytes of decoded tiles load_tile() may keep in memory.
+    
+    0 disables the cache. Lowering the budget evicts the least recently
+    used tiles right away.
+    
+    Args:
+        max_bytes: Memory budget for decoded tile pixels, in bytes
+        
+    Example:
+        >>> set_tile_cache_budget(256 * 1024 * 1024)
+    """
+    global MAX_TILE_CACHE_BYTES, _tile_cache_bytes
+    if max_bytes < 0:
+        raise ValueError(f"Tile cache budget must be >= 0, got {max_bytes}")
+    
+    with _tile_cache_lock:
+        MAX_TILE_CACHE_BYTES = max_bytes
+        while _tile_cache_bytes > max_bytes:
+            _, evicted = _tile_cache.popitem(last=False)
+            _tile_cache_bytes -= _tile_nbytes(evicted[0])
+
+
+def _get_cached_tile(key: tuple) -> Optional[Tuple[Image.Image, Tuple[int, int]]]:
+    """Look up a decoded (image, alpha range), marking it as most recently used."""
+    if not MAX_TILE_CACHE_BYTES:
+        return None
+    with _tile_cache_lock:
+        entry = _tile_cache.get(key)
+        if entry is not None:
+            _tile_cache.move_to_end(key)
+        return entry
+
+
+def _cache_tile(key: tuple, entry: Tuple[Image.Image, Tuple[int, int]]):
+    """Add a decoded (image, alpha range) to the cache, evicting the oldest if over budget."""
+    global _tile_cache_bytes
+    nbytes = _tile_nbytes(entry[0])
+    if nbytes > MAX_TILE_CACHE_BYTES:
+        return
+    
+    with _tile_cache_lock:
+        old = _tile_cache.pop(key, None)
+        if old is not None:
+            _tile_cache_bytes -= _tile_nbytes(old[0])
+        
+        _tile_cache[key] = entry
+        _tile_cache_bytes += nbytes
+        
+        while _tile_cache_bytes > MAX_TILE_CACHE_BYTES:
+            _, evicted = _tile_cache.popitem(last=False)
+            _tile_cache_bytes -= _tile_nbytes(evicted[0])
+
+
+def _tile_nbytes(img: Image.Image) -> int:
+    """Memory held by a decoded tile's pixels."""
+    return img.width * img.height * len(img.getbands())
 
 
 def parse_tile_coords(filename: str) -> Tuple[int, int]:
@@ -78,22 +332,73 @@ def parse_tile_coords(filename: str) -> Tuple[int, int]:
         >>> print(x, y)
         5 10
     """
-    # Extract just the filename if full path provided
-    filename = Path(filename).name
+    coords = parse_tile_coords_or_none(filename)
     
-    # Match pattern: digits_digits.extension
-    match = re.match(r'(\d+)_(\d+)\.\w+$', filename)
-    
-    if not match:
+    if coords is None:
+        if '/' in filename or os.sep in filename:
+            filename = Path(filename).name
         raise ValueError(
             f"Invalid tile filename format: {filename}\n"
             f"Expected format: {{x}}_{{y}}.{{ext}} (e.g., '5_10.webp')"
         )
     
-    x = int(match.group(1))
-    y = int(match.group(2))
+    return coords
+
+
+def parse_tile_coords_or_none(filename: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse tile coordinates from filename, returning None if it doesn't match.
+    
+    Same as parse_tile_coords(), but without raising - cheaper when many
+    names are expected not to be tiles (e.g. while scanning a directory).
     
-    return (x, y)
+    Example:
+        >>> parse_tile_coords_or_none("5_10.webp")
+        (5, 10)
+        >>> parse_tile_coords_or_none("Thumbs.db") is None
+        True
+    """
+    # Extract just the filename if full path provided
+    if '/' in filename or os.sep in filename:
+        filename = Path(filename).name
+    
+    # Fast path for the usual shape, without the regex engine
+    # (isdecimal() accepts exactly what \d matches)
+    stem, _, ext = filename.rpartition('.')
+    x_str, sep, y_str = stem.partition('_')
+    if sep and x_str.isdecimal() and y_str.isdecimal() and ext.isalnum():
+        return (int(x_str), int(y_str))
+    
+    # Match pattern: digits_digits.extension
+    match = _COORD_RE.match(filename)
+    if not match:
+        return None
+    
+    return (int(match.group(1)), int(match.group(2)))
+
+
+@lru_cache(maxsize=256)
+def get_level_folder(map_path: Union[str, Path], layer: int, level: int) -> Path:
+    """
+    Get the directory holding the tiles of one layer and level.
+    
+    Results are cached, so per-tile path building (get_tile_path(),
+    check_tile_exists()) doesn't re-normalize map_path and re-join the
+    level directory for every tile.
+    
+    Args:
+        map_path: Path to map folder (e.g., base_top/)
+        layer: Layer number (0-7 for Build 41)
+        level: Zoom level number
+        
+    Returns:
+        Path to the level directory
+        
+    Example:
+        >>> print(get_level_folder('out/html/map_data/base_top', 0, 15))
+        out/html/map_data/base_top/layer0_files/15
+    """
+    return Path(map_path) / f"layer{layer}_files" / str(level)
 
 
 def get_tile_path(
@@ -123,21 +428,20 @@ def get_tile_path(
         >>> print(path)
         out/html/map_data/base_top/layer0_files/15/5_10.webp
     """
-    map_path = Path(map_path)
-    return map_path / f"layer{layer}_files" / str(level) / f"{x}_{y}.{format}"
+    return get_level_folder(map_path, layer, level) / f"{x}_{y}.{format}"
 
 
-def load_tiles_for_level(
+def scan_tiles_for_level(
     map_path: Union[str, Path],
     layer: int,
     level: int,
     tile_format: Optional[str] = None
 ) -> List[Dict[str, Any]]:
     """
-    Load all tiles for a specific layer and level.
+    List all tiles for a specific layer and level without decoding them.
     
-    Scans the level directory and loads all tiles found.
-    Automatically detects format if not specified.
+    Only the directory is read, so this is cheap even for thousands of
+    tiles. Use iter_tile_images() to decode the tiles one at a time.
     
     Args:
         map_path: Path to map folder
@@ -146,69 +450,499 @@ def load_tiles_for_level(
         tile_format: Optional format filter ('webp', 'png', 'jpg')
         
     Returns:
-        List of dictionaries with keys:
+        List of dictionaries sorted by (y, x), with keys:
             - x: Tile column coordinate
             - y: Tile row coordinate
-            - image: PIL Image in RGBA mode
             - path: Path to tile file
-            - size: Tuple of (width, height)
+            - packed: Only for tiles read from the level's pack (the level
+                      directory is gone); where the tile is in the pack
             
     Example:
-        >>> tiles = load_tiles_for_level('out/html/map_data/base_top', 0, 15)
-        >>> print(f"Loaded {len(tiles)} tiles")
-        Loaded 3498 tiles
+        >>> tiles = scan_tiles_for_level('out/html/map_data/base_top', 0, 15)
         >>> print(tiles[0])
-        {'x': 0, 'y': 16, 'image': <PIL.Image...>, 'path': Path(...), 'size': (300, 249)}
+        {'x': 0, 'y': 16, 'path': Path(...)}
     """
-    map_path = Path(map_path)
-    tile_folder = map_path / f"layer{layer}_files" / str(level)
+    tile_folder = get_level_folder(map_path, layer, level)
     
-    if not tile_folder.exists():
-        logger.warning(f"Tile folder not found: {tile_folder}")
-        return []
+    # The pack is only used once the level directory is gone, and is
+    # resolved once here so loading the tiles needs no per-tile pack lookup
+    pack = None
+    folder_exists = tile_folder.exists()
+    if not folder_exists:
+        pack = _get_pack(tile_folder)
+        if pack is None:
+            logger.warning(f"Tile folder not found: {tile_folder}")
+            return []
     
     tiles = []
     
     # Determine which extensions to scan
     if tile_format:
-        extensions = [f".{tile_format}"]
+        extensions = frozenset((f".{tile_format}",))
     else:
-        extensions = ['.webp', '.png', '.jpg', '.jpeg']
+        extensions = frozenset(('.webp', '.png', '.jpg', '.jpeg'))
     
-    # Scan for tile files
-    for tile_file in tile_folder.iterdir():
-        if tile_file.is_file() and tile_file.suffix.lower() in extensions:
-            try:
-                # Parse coordinates from filename
-                x, y = parse_tile_coords(tile_file.name)
-                
-                # Load the image
-                img = load_tile(tile_file)
+    names = []
+    if folder_exists:
+        # Scan for tile files. scandir() reports the file type from the
+        # directory read itself, so no per-file stat() and no Path for
+        # skipped entries.
+        # All tiles of a level normally share one format: once the first
+        # tile's extension is known, matching names skip the full check
+        detected = None
+        with os.scandir(tile_folder) as entries:
+            for entry in entries:
+                name = entry.name
+                if detected is None or not name.endswith(detected):
+                    ext_idx = name.rfind('.')
+                    if ext_idx < 0:
+                        continue
+                    ext = name[ext_idx:]
+                    if ext.lower() not in extensions:
+                        continue
+                    if detected is None:
+                        detected = ext
+                if entry.is_file():
+                    names.append(name)
+    
+    found = [(name, None) for name in names]
+    if pack is not None:
+        # Level directory removed after packing - list the pack's index
+        pack_path, index_mtime_ns, index = pack
+        for name, (offset, length) in index['tiles'].items():
+            if name[name.rfind('.'):].lower() in extensions:
+                found.append((name, (pack_path, index_mtime_ns, offset, length)))
+    
+    for name, packed in found:
+        # Parse coordinates from filename
+        coords = parse_tile_coords_or_none(name)
+        if coords is None:
+            logger.warning(f"Skipping invalid tile {name}: expected {{x}}_{{y}}.{{ext}}")
+            continue
+        
+        tile = {'x': coords[0], 'y': coords[1], 'path': tile_folder / name}
+        if packed is not None:
+            tile['packed'] = packed
+        tiles.append(tile)
+    
+    # Sort by coordinates (y first, then x) for predictable order
+    tiles.sort(key=itemgetter('y', 'x'))
+    
+    return tiles
+
+
+def iter_tile_images(
+    tiles: List[Dict[str, Any]],
+    max_workers: Optional[int] = None
+) -> Iterator[Tuple[Dict[str, Any], Image.Image]]:
+    """
+    Decode tiles in background threads, yielding them in order.
+    
+    Pillow releases the GIL while decoding, so several worker threads
+    decode ahead while the caller composites. At most 2 × max_workers tiles
+    are decoded ahead of the caller, keeping memory bounded regardless of
+    tile count. Tiles that fail to load are skipped with a warning.
+    
+    Args:
+        tiles: List of tile dictionaries from scan_tiles_for_level()
+        max_workers: Number of decoder threads (default: CPU count).
+                     1 decodes sequentially in the calling thread.
+        
+    Yields:
+        Tuples of (tile_dict, PIL Image from load_tile()), in the order of tiles
+        
+    Example:
+        >>> tiles = scan_tiles_for_level('out/html/map_data/base_top', 0, 15)
+        >>> for tile, img in iter_tile_images(tiles):
+        ...     canvas.paste(img, (tile['x'] * 300, tile['y'] * 300))
+    """
+    for tile, img, _ in _iter_decoded_tiles(tiles, max_workers):
+        yield tile, img
+
+
+def _iter_decoded_tiles(
+    tiles: List[Dict[str, Any]],
+    max_workers: Optional[int] = None
+) -> Iterator[Tuple[Dict[str, Any], Image.Image, Tuple[int, int]]]:
+    """iter_tile_images(), also yielding each tile's (min_alpha, max_alpha)."""
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    
+    if max_workers <= 1 or len(tiles) <= 1:
+        for tile in tiles:
+            decoded = _load_tile_or_warn(tile)
+            if decoded is not None:
+                yield (tile,) + decoded
+        return
+    
+    tile_iter = iter(tiles)
+    pending = deque()
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            # Prime the queue, then submit one new tile per tile consumed
+            for tile in islice(tile_iter, 2 * max_workers):
+                pending.append((tile, executor.submit(_load_tile_or_warn, tile)))
+            
+            while pending:
+                tile, future = pending.popleft()
                 
-                tiles.append({
-                    'x': x,
-                    'y': y,
-                    'image': img,
-                    'path': tile_file,
-                    'size': img.size
-                })
+                next_tile = next(tile_iter, None)
+                if next_tile is not None:
+                    pending.append((next_tile, executor.submit(_load_tile_or_warn, next_tile)))
                 
-            except (ValueError, IOError) as e:
-                logger.warning(f"Skipping invalid tile {tile_file.name}: {e}")
+                decoded = future.result()
+                if decoded is not None:
+                    yield (tile,) + decoded
+        finally:
+            # Caller stopped early - don't decode tiles nobody will use
+            for _, future in pending:
+                future.cancel()
+
+
+def _load_tile_or_warn(tile: Dict[str, Any]) -> Optional[Tuple[Image.Image, Tuple[int, int]]]:
+    """Load a scanned tile as (image, alpha range), or None (with a warning) if unreadable."""
+    if isinstance(tile, LazyTile) and tile._image is not None:
+        return tile._image, tile._alpha_range
+    try:
+        return _load_tile(tile['path'], _get_packed(tile))
+    except IOError as e:
+        logger.warning(f"Skipping invalid tile {tile['path'].name}: {e}")
+        return None
+
+
+class LazyTile(Mapping):
+    """
+    A scanned tile whose pixels are only decoded when first accessed.
     
-    # Sort by coordinates (y first, then x) for predictable order
-    tiles.sort(key=lambda t: (t['y'], t['x']))
+    Supports both attribute access (tile.image) and, as a read-only Mapping,
+    everything callers of eagerly loaded tile dicts use (tile['image'],
+    tile.get(), keys(), dict(tile), ...), with the same keys: x, y, image,
+    path, size and has_alpha. Reading 'image' or 'has_alpha' - including
+    via values(), items() or dict(tile) - decodes the tile.
+    
+    Two LazyTiles are equal if they have the same x, y and path; unlike
+    Mapping equality this never decodes either tile.
+    
+    Example:
+        >>> tile = LazyTile(0, 16, Path('.../layer0_files/15/0_16.webp'))
+        >>> tile.size      # Reads the image header only
+        (300, 249)
+        >>> tile['image']  # Decodes the tile (via load_tile())
+        <PIL.Image.Image image mode=RGBA size=300x249 ...>
+    """
+    
+    __slots__ = ('x', 'y', 'path', '_size', '_image', '_alpha_range', '_packed')
+    
+    # Same order as the dicts load_tiles_for_level(eager=True) returns
+    _KEY_ORDER = ('x', 'y', 'image', 'path', 'size', 'has_alpha')
+    _KEYS = frozenset(_KEY_ORDER)
     
-    logger.info(f"Loaded {len(tiles)} tiles from {tile_folder}")
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        path: Path,
+        size: Optional[Tuple[int, int]] = None,
+        packed: Optional[Tuple[Path, int, int, int]] = None
+    ):
+        self.x = x
+        self.y = y
+        self.path = path
+        self._size = size
+        self._image = None
+        self._alpha_range = None
+        self._packed = packed
+    
+    @property
+    def image(self) -> Image.Image:
+        """Tile pixels in RGBA mode, decoded on first access."""
+        if self._image is None:
+            self._image, self._alpha_range = _load_tile(self.path, self._packed)
+            self._size = self._image.size
+        return self._image
+    
+    @property
+    def has_alpha(self) -> bool:
+        """Whether the tile has transparent pixels (decodes the tile)."""
+        self.image
+        return self._alpha_range[0] < 255
+    
+    @property
+    def size(self) -> Tuple[int, int]:
+        """Tile (width, height), read from the image header if not yet known."""
+        if self._size is None:
+            self._size = _load_tile_header(self.path, self._packed)[0]
+        return self._size
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._KEYS
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEY_ORDER)
+    
+    def __len__(self) -> int:
+        return len(self._KEY_ORDER)
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LazyTile):
+            return NotImplemented
+        return (self.x, self.y, self.path) == (other.x, other.y, other.path)
+    
+    def __hash__(self) -> int:
+        return hash((self.x, self.y, self.path))
+    
+    def __repr__(self) -> str:
+        state = 'loaded' if self._image is not None else 'not loaded'
+        return f"LazyTile(x={self.x}, y={self.y}, path={self.path!r}, {state})"
+
+
+def load_tiles_for_level(
+    map_path: Union[str, Path],
+    layer: int,
+    level: int,
+    tile_format: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    eager: bool = False
+) -> List[Union[LazyTile, Dict[str, Any]]]:
+    """
+    Load all tiles for a specific layer and level.
+    
+    Scans the level directory and loads all tiles found.
+    Automatically detects format if not specified.
+    
+    By default tiles are returned as LazyTile handles, which decode their
+    pixels only when 'image' is first accessed, so tiles the caller never
+    looks at cost no memory. With eager=True every tile is decoded up front
+    in parallel on a thread pool (see iter_tile_images()) and kept in
+    memory; opaque tiles are then stored as RGB, 25% smaller. For large
+    levels prefer scan_tiles_for_level() + iter_tile_images(), which
+    stream the tiles.
+    
+    Args:
+        map_path: Path to map folder
+        layer: Layer number (0-7 for Build 41)
+        level: Zoom level number
+        tile_format: Optional format filter ('webp', 'png', 'jpg')
+        max_workers: Number of decoder threads when eager (default: CPU count).
+                     1 loads sequentially in the calling thread.
+        eager: Decode all tiles now and return plain dictionaries
+        
+    Returns:
+        List of tiles sorted by (y, x): LazyTile handles, or with eager=True
+        dictionaries. Both support tile[key] with keys:
+            - x: Tile column coordinate
+            - y: Tile row coordinate
+            - image: PIL Image in RGBA mode (eager: RGB if the tile is opaque)
+            - path: Path to tile file
+            - size: Tuple of (width, height)
+            - has_alpha: True if the tile has transparent pixels
+            
+    Example:
+        >>> tiles = load_tiles_for_level('out/html/map_data/base_top', 0, 15, eager=True)
+        >>> print(f"Loaded {len(tiles)} tiles")
+        Loaded 3498 tiles
+        >>> print(tiles[0])
+        {'x': 0, 'y': 16, 'image': <PIL.Image...>, 'path': Path(...), 'size': (300, 249),
+         'has_alpha': True}
+    """
+    scanned = scan_tiles_for_level(map_path, layer, level, tile_format)
+    
+    if not eager:
+        return [LazyTile(tile['x'], tile['y'], tile['path'], packed=tile.get('packed'))
+                for tile in scanned]
+    
+    tiles = []
+    for tile, img, alpha_range in _iter_decoded_tiles(scanned, max_workers):
+        transparent = alpha_range[0] < 255
+        if not transparent:
+            # Kept in memory: drop the all-255 alpha band
+            img = img.convert('RGB')
+        tiles.append({
+            'x': tile['x'],
+            'y': tile['y'],
+            'image': img,
+            'path': tile['path'],
+            'size': img.size,
+            'has_alpha': transparent
+        })
+    
+    if scanned:
+        logger.info(f"Loaded {len(tiles)} tiles from {scanned[0]['path'].parent}")
     return tiles
 
 
+def pack_level(
+    map_path: Union[str, Path],
+    layer: int,
+    level: int
+) -> Path:
+    """
+    Pack all tiles of a level into a single file with an offset index.
+    
+    Opening thousands of small files is slow on some filesystems (notably
+    NTFS with antivirus scanning). The packed form stores every tile's
+    encoded bytes back to back in layer{N}_files/{level}.pack, with a JSON
+    index mapping each tile filename to its (offset, length).
+    
+    The loaders in this module (load_tile(), scan_tiles_for_level(),
+    check_tile_exists(), ...) read from the pack only once the level
+    directory has been deleted. While the directory exists the pack is
+    ignored entirely, so tiles regenerated or removed since packing never
+    mix with stale packed ones. Pack again after regenerating a level.
+    
+    This is a scripting-only API: the GUI never packs levels, it only
+    reads packs created this way.
+    
+    Args:
+        map_path: Path to map folder
+        layer: Layer number (0-7 for Build 41)
+        level: Zoom level number
+        
+    Returns:
+        Path to the written .pack file
+        
+    Raises:
+        FileNotFoundError: If the level directory doesn't exist
+        ValueError: If the level directory contains no tiles
+        
+    Example:
+        >>> pack_level('out/html/map_data/base_top', 0, 15)
+        PosixPath('out/html/map_data/base_top/layer0_files/15.pack')
+    """
+    tile_folder = get_level_folder(map_path, layer, level)
+    
+    if not tile_folder.is_dir():
+        raise FileNotFoundError(f"Tile folder not found: {tile_folder}")
+    
+    # Only the tile files: tiles already in an older pack are not carried over
+    tiles = [tile for tile in scan_tiles_for_level(map_path, layer, level)
+             if 'packed' not in tile]
+    if not tiles:
+        raise ValueError(f"No tiles found in {tile_folder}")
+    
+    pack_path, index_path = _get_pack_paths(tile_folder)
+    tmp_pack = pack_path.with_name(pack_path.name + '.tmp')
+    tmp_index = index_path.with_name(index_path.name + '.tmp')
+    
+    entries = {}
+    offset = 0
+    with open(tmp_pack, 'wb') as out:
+        for tile in tiles:
+            data = tile['path'].read_bytes()
+            out.write(data)
+            entries[tile['path'].name] = [offset, len(data)]
+            offset += len(data)
+    
+    with open(tmp_index, 'w', encoding='utf-8') as f:
+        json.dump({'tiles': entries}, f)
+    
+    # Release any mapping of an older pack before replacing it (required on Windows)
+    _map_pack.cache_clear()
+    os.replace(tmp_pack, pack_path)
+    os.replace(tmp_index, index_path)
+    
+    logger.info(f"Packed {len(entries)} tiles ({offset} bytes) into {pack_path}")
+    return pack_path
+
+
+def _get_pack_paths(tile_folder: Path) -> Tuple[Path, Path]:
+    """Paths of the pack file and its index for a level directory."""
+    parent = tile_folder.parent
+    return (parent / f"{tile_folder.name}{PACK_SUFFIX}",
+            parent / f"{tile_folder.name}{PACK_INDEX_SUFFIX}")
+
+
+def _get_pack(tile_folder: Path) -> Optional[Tuple[Path, int, Dict[str, Any]]]:
+    """
+    Get the usable pack for a level directory, if there is one.
+    
+    Returns (pack_path, index_mtime_ns, index), or None if the level isn't
+    packed. index['tiles'] maps each filename to [offset, length], and
+    index['names'] maps lowercased filenames to the stored ones.
+    """
+    pack_path, index_path = _get_pack_paths(tile_folder)
+    
+    try:
+        index_mtime_ns = os.stat(index_path).st_mtime_ns
+    except OSError:
+        return None
+    
+    index = _read_pack_index(str(index_path), index_mtime_ns)
+    if index is None:
+        return None
+    
+    return pack_path, index_mtime_ns, index
+
+
+def _find_packed_tile(tile_path: Path) -> Optional[Tuple[Path, int, int, int]]:
+    """
+    Locate a tile in its level's pack: (pack_path, index_mtime_ns, offset, length).
+    
+    Only called once the tile's file is known to be missing. Returns None
+    while the level directory exists: the pack then doesn't apply.
+    """
+    if tile_path.parent.exists():
+        return None
+    pack = _get_pack(tile_path.parent)
+    if pack is None:
+        return None
+    entry = pack[2]['tiles'].get(tile_path.name)
+    if entry is None:
+        return None
+    return pack[0], pack[1], entry[0], entry[1]
+
+
+def _read_packed_tile(pack_path: Path, index_mtime_ns: int, offset: int, length: int) -> bytes:
+    """
+    Read one tile's encoded bytes from a pack file.
+    
+    Slicing the mmap is the only copy: BytesIO shares a bytes object's
+    buffer and read() hands it back as-is. A memoryview slice would be
+    copied by BytesIO and again by read().
+    """
+    return _map_pack(str(pack_path), index_mtime_ns)[offset:offset + length]
+
+
+@lru_cache(maxsize=64)
+def _read_pack_index(index_path: str, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """Parse a pack index (mtime_ns keys the cache to the file's contents)."""
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if 'tiles' not in index:
+            raise ValueError("missing 'tiles'")
+        # For case-insensitive lookups (check_tile_exists())
+        index['names'] = {name.lower(): name for name in index['tiles']}
+        return index
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring invalid pack index {index_path}: {e}")
+        return None
+
+
+@lru_cache(maxsize=16)
+def _map_pack(pack_path: str, index_mtime_ns: int) -> mmap.mmap:
+    """Memory-map a pack file read-only; mappings are shared between threads."""
+    with open(pack_path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
 def get_tile_bounds(tiles: List[Dict[str, Any]]) -> Dict[str, int]:
     """
     Calculate the bounding box of a set of tiles.
     
+    Edge tiles may be smaller than the tile size. Their sizes come from the
+    'size' key when present (load_tiles_for_level()); for tiles from
+    scan_tiles_for_level() only the edge tiles' image headers are read.
+    
     Args:
         tiles: List of tile dictionaries from load_tiles_for_level()
+               or scan_tiles_for_level()
         
     Returns:
         Dictionary with keys:
@@ -218,26 +952,53 @@ def get_tile_bounds(tiles: List[Dict[str, Any]]) -> Dict[str, int]:
             - max_y: Bottommost tile row
             - cols: Number of columns
             - rows: Number of rows
+            - rightmost_width: Widest tile in the rightmost column
+            - bottommost_height: Tallest tile in the bottom row
             
     Example:
         >>> tiles = load_tiles_for_level('out/html/map_data/base_top', 0, 15)
         >>> bounds = get_tile_bounds(tiles)
         >>> print(bounds)
-        {'min_x': 0, 'min_y': 16, 'max_x': 65, 'max_y': 68, 'cols': 66, 'rows': 53}
+        {'min_x': 0, 'min_y': 16, 'max_x': 65, 'max_y': 68, 'cols': 66, 'rows': 53,
+         'rightmost_width': 300, 'bottommost_height': 249}
     """
     if not tiles:
         return {
             'min_x': 0, 'min_y': 0, 'max_x': 0, 'max_y': 0,
-            'cols': 0, 'rows': 0
+            'cols': 0, 'rows': 0,
+            'rightmost_width': 0, 'bottommost_height': 0
         }
     
-    x_coords = [t['x'] for t in tiles]
-    y_coords = [t['y'] for t in tiles]
+    # Single pass: running min/max, plus the tiles in the rightmost column
+    # and bottom row seen so far (restarted whenever the max grows)
+    first = tiles[0]
+    min_x = max_x = first['x']
+    min_y = max_y = first['y']
+    right_col = []
+    bottom_row = []
+    for t in tiles:
+        x = t['x']
+        y = t['y']
+        
+        if x > max_x:
+            max_x = x
+            right_col = [t]
+        elif x == max_x:
+            right_col.append(t)
+        elif x < min_x:
+            min_x = x
+        
+        if y > max_y:
+            max_y = y
+            bottom_row = [t]
+        elif y == max_y:
+            bottom_row.append(t)
+        elif y < min_y:
+            min_y = y
     
-    min_x = min(x_coords)
-    max_x = max(x_coords)
-    min_y = min(y_coords)
-    max_y = max(y_coords)
+    # Edge tile extents (only these tiles' sizes are needed)
+    rightmost_width = max(_get_tile_size(t)[0] for t in right_col)
+    bottommost_height = max(_get_tile_size(t)[1] for t in bottom_row)
     
     return {
         'min_x': min_x,
@@ -245,10 +1006,27 @@ def get_tile_bounds(tiles: List[Dict[str, Any]]) -> Dict[str, int]:
         'max_x': max_x,
         'max_y': max_y,
         'cols': max_x - min_x + 1,
-        'rows': max_y - min_y + 1
+        'rows': max_y - min_y + 1,
+        'rightmost_width': rightmost_width,
+        'bottommost_height': bottommost_height
     }
 
 
+def _get_tile_size(tile: Dict[str, Any]) -> Tuple[int, int]:
+    """Get a tile's (width, height), reading only the image header if needed."""
+    if 'size' in tile:
+        return tile['size']
+    return _load_tile_header(tile['path'], _get_packed(tile))[0]
+
+
+def _get_packed(tile: Dict[str, Any]) -> Optional[Tuple[Path, int, int, int]]:
+    """A scanned tile's pack location, or None if it is read from its file."""
+    if isinstance(tile, LazyTile):
+        # Not one of LazyTile's keys, which match the eager tile dicts
+        return tile._packed
+    return tile.get('packed')
+
+
 def check_tile_exists(
     map_path: Union[str, Path],
     layer: int,
@@ -260,6 +1038,11 @@ def check_tile_exists(
     """
     Check if a tile file exists, trying multiple formats.
     
+    The level directory is listed once and the listing is reused until the
+    directory changes, so checking every tile of a level costs one scan
+    rather than a stat() per tile and format. File names are matched
+    case-insensitively.
+    
     Args:
         map_path: Path to map folder
         layer: Layer number
@@ -269,7 +1052,7 @@ def check_tile_exists(
         formats: List of formats to try (default: ['webp', 'png', 'jpg'])
         
     Returns:
-        Path to tile file if found, None otherwise
+        Path to tile file (spelled as on disk) if found, None otherwise
         
     Example:
         >>> path = check_tile_exists('out/html/map_data/base_top', 0, 15, 0, 16)
@@ -279,12 +1062,37 @@ def check_tile_exists(
     if formats is None:
         formats = ['webp', 'png', 'jpg']
     
-    map_path = Path(map_path)
+    tile_folder = get_level_folder(map_path, layer, level)
+    
+    # 0_16.WEBP is found when looking for 0_16.webp, on any filesystem
+    filenames = [f"{x}_{y}.{fmt}".lower() for fmt in formats]
     
-    for fmt in formats:
-        tile_path = get_tile_path(map_path, layer, level, x, y, fmt)
-        if tile_path.exists():
-            return tile_path
+    try:
+        mtime_ns = os.stat(tile_folder).st_mtime_ns
+    except OSError:
+        # Level directory removed after packing - check the pack's index
+        pack = _get_pack(tile_folder)
+        if pack is None:
+            return None
+        names = pack[2]['names']
+    else:
+        names = _list_tile_folder(str(tile_folder), mtime_ns)
+    
+    for filename in filenames:
+        name = names.get(filename)
+        if name is not None:
+            return tile_folder / name
     
     return None
 
+
+@lru_cache(maxsize=64)
+def _list_tile_folder(folder: str, mtime_ns: int) -> Dict[str, str]:
+    """
+    Files in a level directory, as {lowercased name: name}.
+    
+    mtime_ns keys the cache to the directory's contents.
+    """
+    with os.scandir(folder) as entries:
+        return {entry.name.lower(): entry.name for entry in entries if entry.is_file()}
+
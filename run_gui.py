@@ -3,13 +3,18 @@ Project Zomboid Map Stitcher - GUI Application
 
 Launch the GUI interface for generating map images from DZI tiles.
 """
+import logging
 import sys
-from check_dependencies import prompt_install_missing
+from check_dependencies import check_dependencies_cached
 
 
 if __name__ == "__main__":
-    # Check dependencies before starting GUI
-    if not prompt_install_missing():
+    # Show the stitcher's progress messages on the console
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
+    # Check dependencies before starting GUI (skipped if unchanged since the
+    # last successful check)
+    if not check_dependencies_cached():
         print("\nExiting due to missing dependencies.")
         sys.exit(1)
     
@@ -0,0 +1,82 @@
+"""
+Shared test fixtures: small synthetic maps in the pzmapdzi2img layout.
+
+    <map>/map_info.json
+    <map>/layer{N}.dzi
+    <map>/layer{N}_files/{level}/{x}_{y}.png
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+# Make the repository root importable without installing it
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from map_image_generator.pyramid import build_pyramid
+from map_image_generator.tile_loader import clear_tile_cache
+
+DZI_TEMPLATE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<Image xmlns="http://schemas.microsoft.com/deepzoom/2008" '
+    'TileSize="{tile_size}" Overlap="0" Format="png">'
+    '<Size Width="{width}" Height="{height}"/></Image>'
+)
+
+
+def random_image(width, height, alphas=(255,), seed=0):
+    """RGBA image of random 3×3 blocks, alpha picked from alphas."""
+    rng = random.Random(seed)
+    img = Image.new('RGBA', (width, height))
+    for y in range(0, height, 3):
+        for x in range(0, width, 3):
+            color = (rng.randrange(256), rng.randrange(256), rng.randrange(256),
+                     rng.choice(alphas))
+            img.paste(color, (x, y, min(x + 3, width), min(y + 3, height)))
+    return img
+
+
+def write_map(map_path, image, x0=0, y0=0, layer=0, tile_size=16, skip=0):
+    """
+    Write image as a DZI pyramid of PNG tiles, with map_info.json.
+    
+    Returns the map folder as a Path.
+    """
+    map_path = Path(map_path)
+    width, height = image.size
+    
+    map_path.mkdir(parents=True, exist_ok=True)
+    (map_path / 'map_info.json').write_text(json.dumps({
+        'w': width, 'h': height, 'x0': x0, 'y0': y0,
+        'cell_size': 300, 'skip': skip, 'sqr': 1, 'pz_version': 'B41'
+    }))
+    (map_path / f'layer{layer}.dzi').write_text(
+        DZI_TEMPLATE.format(tile_size=tile_size, width=width, height=height)
+    )
+    
+    for level, (level_w, level_h) in enumerate(build_pyramid(width, height)):
+        if level < skip:
+            continue
+        
+        level_img = image if (level_w, level_h) == image.size else image.resize((level_w, level_h))
+        folder = map_path / f'layer{layer}_files' / str(level)
+        folder.mkdir(parents=True, exist_ok=True)
+        for ty in range(0, level_h, tile_size):
+            for tx in range(0, level_w, tile_size):
+                tile = level_img.crop((tx, ty, min(tx + tile_size, level_w),
+                                       min(ty + tile_size, level_h)))
+                tile.save(folder / f'{tx // tile_size}_{ty // tile_size}.png')
+    
+    return map_path
+
+
+@pytest.fixture(autouse=True)
+def _fresh_tile_cache():
+    """Decoded tiles must not leak between tests."""
+    clear_tile_cache()
+    yield
+    clear_tile_cache()
@@ -0,0 +1,73 @@
+"""Tests for map_image_generator.bounds."""
+
+import json
+
+import pytest
+from PIL import Image
+
+from map_image_generator.bounds import (
+    PACKED_MAP_FIELDS,
+    calculate_global_bounds,
+    calculate_global_bounds_packed,
+    validate_map_compatibility,
+    validate_map_compatibility_fast,
+)
+from map_image_generator.stitcher import stitch_multi_map
+
+from conftest import write_map
+
+
+def _write_maps(tmp_path):
+    image = Image.new('RGB', (40, 24))
+    return [
+        write_map(tmp_path / 'base_top', image),
+        write_map(tmp_path / 'mod_maps' / 'ModA' / 'base_top', image.resize((20, 30)), x0=15, y0=-50),
+        write_map(tmp_path / 'mod_maps' / 'ModB' / 'base_top', image.resize((8, 8)), x0=-100, y0=4),
+    ]
+
+
+def test_packed_bounds_match_per_map_dicts(tmp_path):
+    map_paths = _write_maps(tmp_path)
+    bounds = calculate_global_bounds(map_paths)
+    packed = calculate_global_bounds_packed(map_paths)
+    
+    for key in ('min_x', 'min_y', 'max_x', 'max_y', 'width', 'height'):
+        assert packed[key] == bounds[key]
+    assert (packed['min_x'], packed['min_y'], packed['max_x'], packed['max_y']) == (-15, -4, 108, 80)
+    
+    stride = len(PACKED_MAP_FIELDS)
+    assert packed['names'] == [m['name'] for m in bounds['maps']]
+    assert len(packed['packed']) == stride * len(map_paths)
+    for row, m in enumerate(bounds['maps']):
+        values = packed['packed'][row * stride:(row + 1) * stride]
+        assert list(values) == [m[field] for field in PACKED_MAP_FIELDS]
+
+
+def _set_map_info(map_path, **values):
+    info_path = map_path / 'map_info.json'
+    info = json.loads(info_path.read_text())
+    info.update(values)
+    info_path.write_text(json.dumps(info))
+
+
+@pytest.mark.parametrize('changes, compatible', [
+    ({}, True),
+    ({'pz_version': 'B42'}, True),  # Only a warning
+    ({'sqr': 2}, False),
+    ({'cell_size': 256}, False),
+])
+def test_fast_compatibility_check_agrees_with_full_check(tmp_path, changes, compatible):
+    map_paths = _write_maps(tmp_path)
+    _set_map_info(map_paths[2], **changes)
+    
+    assert validate_map_compatibility(map_paths)['compatible'] is compatible
+    assert validate_map_compatibility_fast(map_paths) is compatible
+    assert validate_map_compatibility_fast([]) is False
+
+
+def test_stitch_multi_map_reports_why_maps_are_incompatible(tmp_path):
+    map_paths = _write_maps(tmp_path)
+    _set_map_info(map_paths[1], sqr=2)
+    
+    with pytest.raises(ValueError, match='different sqr values'):
+        stitch_multi_map(map_paths, 0, 6, tmp_path / 'out.png')
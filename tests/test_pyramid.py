@@ -0,0 +1,56 @@
+"""Tests for map_image_generator.pyramid."""
+
+import random
+
+import pytest
+
+from map_image_generator.pyramid import (
+    build_pyramid,
+    calculate_num_levels,
+    get_max_level,
+    get_pyramid_info,
+)
+
+
+def _pyramid_by_halving(width, height):
+    """Reference: the original loop, halving (rounding up) until 1x1."""
+    pyramid = [(width, height)]
+    while pyramid[-1] != (1, 1):
+        w, h = pyramid[-1]
+        pyramid.append(((w + 1) // 2, (h + 1) // 2))
+    pyramid.reverse()
+    return pyramid
+
+
+def _sizes():
+    """Edge cases around powers of two, plus random sizes."""
+    sizes = [(1, 1), (1, 2), (2, 1), (3, 3), (19800, 15900), (300, 1200), (1200, 1200)]
+    for p in range(1, 20):
+        n = 2 ** p
+        sizes += [(n - 1, 1), (n, 1), (n + 1, 1), (1, n), (1, n + 1), (n, n)]
+    rng = random.Random(0)
+    sizes += [(rng.randint(1, 100000), rng.randint(1, 100000)) for _ in range(500)]
+    return sizes
+
+
+def test_closed_form_matches_halving_loop():
+    for width, height in _sizes():
+        expected = _pyramid_by_halving(width, height)
+        assert calculate_num_levels(width, height) == len(expected), (width, height)
+        assert get_max_level(width, height) == len(expected) - 1
+        assert list(build_pyramid(width, height)) == expected, (width, height)
+
+
+def test_documented_examples():
+    pyramid = build_pyramid(19800, 15900)
+    assert len(pyramid) == 16
+    assert pyramid[9] == (310, 249)
+    assert get_pyramid_info(19800, 15900)['tiles_per_level'][15] == (66, 53)
+
+
+@pytest.mark.parametrize('width, height', [(0, 10), (10, 0), (-1, 5)])
+def test_non_positive_dimensions_are_rejected(width, height):
+    with pytest.raises(ValueError):
+        calculate_num_levels(width, height)
+    with pytest.raises(ValueError):
+        build_pyramid(width, height)
@@ -0,0 +1,155 @@
+"""Tests for map_image_generator.stitcher."""
+
+import pytest
+from PIL import Image
+
+from map_image_generator.bounds import calculate_global_bounds
+from map_image_generator.pyramid import build_pyramid
+from map_image_generator.stitcher import (
+    _calculate_map_levels,
+    _stitch_map_onto_canvas,
+    stitch_multi_map,
+    stitch_single_map,
+)
+
+from conftest import random_image, write_map
+
+
+def _normalized(img):
+    """RGBA pixels with fully transparent pixels zeroed (their color is irrelevant)."""
+    img = img.convert('RGBA')
+    blank = Image.new('RGBA', img.size, (0, 0, 0, 0))
+    return Image.composite(img, blank, img.getchannel('A').point(lambda a: 255 if a else 0)).tobytes()
+
+
+def _reference(maps, level_offset=0):
+    """
+    Naive stitch: every map's whole level image alpha-composited in order.
+    
+    maps is a list of (image, world_x, world_y); level_offset counts levels
+    below full resolution (all maps must have the same pyramid depth).
+    """
+    scale = 0.5 ** level_offset
+    min_x = min(x for _, x, _ in maps)
+    min_y = min(y for _, _, y in maps)
+    width = max(x + img.width for img, x, _ in maps) - min_x
+    height = max(y + img.height for img, _, y in maps) - min_y
+    
+    canvas = Image.new('RGBA', (int(width * scale), int(height * scale)), (0, 0, 0, 0))
+    for img, x, y in maps:
+        pyramid = build_pyramid(*img.size)
+        level_img = img if not level_offset else img.resize(pyramid[-1 - level_offset])
+        layer = Image.new('RGBA', canvas.size, (0, 0, 0, 0))
+        layer.paste(level_img, (round((x - min_x) * scale), round((y - min_y) * scale)))
+        canvas.alpha_composite(layer)
+    return canvas
+
+
+@pytest.fixture
+def overlapping_maps(tmp_path):
+    """
+    A base map and two semi-transparent mods overlapping it and each other.
+    
+    All three are 6 levels deep (max side 33-64 px) with 16-pixel tiles;
+    the mods are offset by amounts that are not multiples of the tile size.
+    """
+    root = tmp_path / 'map_data'
+    specs = [
+        (root / 'base_top', random_image(48, 40, seed=1), 0, 0),
+        (root / 'mod_maps' / 'ModA' / 'base_top',
+         random_image(36, 30, alphas=(0, 128, 255), seed=2), 10, 6),
+        (root / 'mod_maps' / 'ModB' / 'base_top',
+         random_image(40, 34, alphas=(0, 64, 200, 255), seed=3), 30, 22),
+    ]
+    # x0/y0 are negated world coordinates
+    paths = [write_map(path, img, x0=-x, y0=-y) for path, img, x, y in specs]
+    return paths, [(img, x, y) for _, img, x, y in specs]
+
+
+@pytest.mark.parametrize('level_offset', [0, 1])
+def test_multi_map_matches_naive_compositing(overlapping_maps, tmp_path, level_offset):
+    paths, maps = overlapping_maps
+    out = stitch_multi_map(paths, 0, 6 - level_offset, tmp_path / 'out.png')
+    
+    with Image.open(out) as result:
+        expected = _reference(maps, level_offset)
+        assert result.size == expected.size
+        assert _normalized(result) == _normalized(expected)
+
+
+def test_painted_rects_paste_matches_compositing_every_tile(overlapping_maps):
+    paths, _ = overlapping_maps
+    bounds = calculate_global_bounds(paths, 0)
+    map_levels = _calculate_map_levels(paths, 0, 6)
+    
+    canvases = []
+    for painted_rects in ([], None):
+        canvas = Image.new('RGBA', (bounds['width'], bounds['height']), (0, 0, 0, 0))
+        for path in paths:
+            _stitch_map_onto_canvas(canvas, path, 0, map_levels, bounds, 1.0,
+                                    painted_rects=painted_rects)
+        canvases.append(canvas)
+    
+    assert _normalized(canvases[0]) == _normalized(canvases[1])
+
+
+def test_painted_rects_records_each_maps_drawn_area(overlapping_maps):
+    paths, maps = overlapping_maps
+    bounds = calculate_global_bounds(paths, 0)
+    map_levels = _calculate_map_levels(paths, 0, 6)
+    canvas = Image.new('RGBA', (bounds['width'], bounds['height']), (0, 0, 0, 0))
+    
+    painted_rects = []
+    for path in paths:
+        _stitch_map_onto_canvas(canvas, path, 0, map_levels, bounds, 1.0,
+                                painted_rects=painted_rects)
+    
+    assert painted_rects == [(x, y, x + img.width, y + img.height) for img, x, y in maps]
+
+
+def test_single_map_matches_source_image(tmp_path):
+    image = random_image(40, 24, alphas=(0, 128, 255))
+    map_path = write_map(tmp_path / 'base_top', image)
+    
+    out = stitch_single_map(map_path, 0, 6, tmp_path / 'out.png')
+    with Image.open(out) as result:
+        assert _normalized(result) == _normalized(image)
+
+
+@pytest.mark.parametrize('offset', [(16, 32), (10, 6), (7, 3)])
+@pytest.mark.parametrize('level_offset', [0, 1])
+def test_tile_placement_on_and_off_the_pixel_grid(tmp_path, offset, level_offset):
+    # (16, 32) is tile-aligned; (10, 6) lands on whole canvas pixels one level
+    # out (exact-grid path); (7, 3) doesn't, so positions are rounded per tile
+    root = tmp_path / 'map_data'
+    base = random_image(48, 40, seed=4)
+    mod = random_image(36, 30, alphas=(0, 128, 255), seed=5)
+    paths = [write_map(root / 'base_top', base),
+             write_map(root / 'mod_maps' / 'Mod' / 'base_top', mod, x0=-offset[0], y0=-offset[1])]
+    
+    out = stitch_multi_map(paths, 0, 6 - level_offset, tmp_path / 'out.png')
+    with Image.open(out) as result:
+        expected = _reference([(base, 0, 0), (mod, offset[0], offset[1])], level_offset)
+        assert result.size == expected.size
+        assert _normalized(result) == _normalized(expected)
+
+
+def test_mod_without_low_levels_is_downscaled_not_dropped(tmp_path):
+    # The mod only has levels 5 (its full resolution) and up; three levels
+    # out it must be drawn from level 5, shrunk 8×, rather than left out
+    root = tmp_path / 'map_data'
+    base = Image.new('RGBA', (48, 40), (255, 0, 0, 255))
+    mod = Image.new('RGBA', (32, 24), (0, 0, 255, 255))
+    paths = [write_map(root / 'base_top', base),
+             write_map(root / 'mod_maps' / 'Mod' / 'base_top', mod, x0=-16, y0=-8, skip=5)]
+    assert not (paths[1] / 'layer0_files' / '2').exists()
+    
+    map_levels = _calculate_map_levels(paths, 0, 3)
+    assert map_levels['zoom_out'] == 3
+    assert map_levels['map_info'][paths[1]]['actual_level'] == 5
+    
+    out = stitch_multi_map(paths, 0, 3, tmp_path / 'out.png')
+    with Image.open(out) as result:
+        expected = Image.new('RGBA', (6, 5), (255, 0, 0, 255))
+        expected.paste((0, 0, 255, 255), (2, 1, 6, 4))
+        assert _normalized(result) == _normalized(expected)
@@ -0,0 +1,432 @@
+"""Tests for map_image_generator.tile_loader."""
+
+import os
+import random
+import shutil
+from pathlib import Path
+
+import pytest
+from PIL import Image
+from PIL.JpegImagePlugin import JpegImageFile
+
+from map_image_generator import tile_loader
+from map_image_generator.tile_loader import (
+    check_tile_exists,
+    get_level_folder,
+    get_tile_bounds,
+    load_tile,
+    load_tile_header,
+    load_tiles_for_level,
+    pack_level,
+    parse_tile_coords,
+    parse_tile_coords_or_none,
+    scan_tiles_for_level,
+)
+
+from conftest import random_image, write_map
+
+
+@pytest.fixture
+def level_map(tmp_path):
+    """A 40×24 map with 16-pixel tiles: level 6 is a 3×2 grid."""
+    image = random_image(40, 24, alphas=(0, 128, 255))
+    return write_map(tmp_path / 'base_top', image), image
+
+
+def _pixels(img):
+    return img.convert('RGBA').tobytes()
+
+
+# ---- Packed levels --------------------------------------------------------
+
+def test_packed_level_is_used_once_tile_files_are_removed(level_map):
+    map_path, _ = level_map
+    folder = get_level_folder(map_path, 0, 6)
+    expected = {p.name: _pixels(Image.open(p)) for p in folder.iterdir()}
+    
+    pack_level(map_path, 0, 6)
+    shutil.rmtree(folder)
+    
+    tiles = scan_tiles_for_level(map_path, 0, 6)
+    assert [(t['x'], t['y']) for t in tiles] == [(0, 0), (1, 0), (2, 0), (0, 1), (1, 1), (2, 1)]
+    assert all('packed' in t for t in tiles)
+    
+    for tile in tiles:
+        img = load_tile(tile['path'])
+        assert _pixels(img) == expected[tile['path'].name]
+        assert load_tile_header(tile['path'])[0] == img.size
+    
+    lazy = load_tiles_for_level(map_path, 0, 6)
+    assert _pixels(lazy[0]['image']) == expected['0_0.png']
+    assert check_tile_exists(map_path, 0, 6, 2, 1) == folder / '2_1.png'
+    assert check_tile_exists(map_path, 0, 6, 3, 1) is None
+
+
+def test_tile_file_rewritten_in_place_wins_over_pack(level_map):
+    map_path, _ = level_map
+    folder = get_level_folder(map_path, 0, 6)
+    pack_level(map_path, 0, 6)
+    
+    # Same file name, so the level directory's mtime doesn't change
+    new_tile = Image.new('RGBA', (16, 16), (1, 2, 3, 255))
+    new_tile.save(folder / '0_0.png')
+    
+    assert load_tile(folder / '0_0.png').getpixel((0, 0))[:3] == (1, 2, 3)
+    
+    tiles = scan_tiles_for_level(map_path, 0, 6)
+    assert not any('packed' in t for t in tiles)
+    assert tile_loader._load_tile_or_warn(tiles[0])[0].getpixel((0, 0))[:3] == (1, 2, 3)
+
+
+def test_pack_is_ignored_while_level_directory_exists(level_map):
+    # A regenerated level may drop tiles (now blank) - they must not come
+    # back from an older pack
+    map_path, _ = level_map
+    folder = get_level_folder(map_path, 0, 6)
+    pack_level(map_path, 0, 6)
+    (folder / '2_1.png').unlink()
+    
+    tiles = scan_tiles_for_level(map_path, 0, 6)
+    assert [t['path'].name for t in tiles] == ['0_0.png', '1_0.png', '2_0.png', '0_1.png', '1_1.png']
+    assert not any('packed' in t for t in tiles)
+    with pytest.raises(FileNotFoundError):
+        load_tile(folder / '2_1.png')
+    with pytest.raises(FileNotFoundError):
+        load_tile_header(folder / '2_1.png')
+    assert check_tile_exists(map_path, 0, 6, 2, 1) is None
+
+
+def test_loading_unpacked_tiles_never_looks_for_a_pack(level_map, monkeypatch):
+    map_path, _ = level_map
+    tiles = scan_tiles_for_level(map_path, 0, 6)
+    
+    def fail(*args):
+        raise AssertionError("pack looked up for a tile file that exists")
+    monkeypatch.setattr(tile_loader, '_get_pack', fail)
+    
+    for tile in tiles:
+        load_tile(tile['path'])
+        load_tile_header(tile['path'])
+    assert len(list(tile_loader.iter_tile_images(tiles))) == 6
+
+
+# ---- Decoded tile cache ---------------------------------------------------
+
+def test_tile_cache_is_off_by_default(level_map):
+    map_path, _ = level_map
+    path = get_level_folder(map_path, 0, 6) / '0_0.png'
+    
+    assert load_tile(path) is not load_tile(path)
+    assert not tile_loader._tile_cache
+
+
+def test_tile_cache_evicts_least_recently_used_over_budget(level_map, monkeypatch):
+    map_path, _ = level_map
+    folder = get_level_folder(map_path, 0, 6)
+    a, b, c = (folder / name for name in ('0_0.png', '1_0.png', '2_0.png'))
+    
+    # 16×16 RGBA tiles are 1024 bytes: room for two, not three
+    monkeypatch.setattr(tile_loader, 'MAX_TILE_CACHE_BYTES', 2 * 1024)
+    
+    img_a = load_tile(a)
+    load_tile(b)
+    assert load_tile(a) is img_a  # Hit: a is now most recently used
+    
+    load_tile(c)  # Evicts b
+    assert load_tile(a) is img_a
+    assert [key[0] for key in tile_loader._tile_cache] == [str(c), str(a)]
+    assert tile_loader._tile_cache_bytes == sum(
+        img.width * img.height * len(img.getbands()) for img, _ in tile_loader._tile_cache.values()
+    )
+    assert tile_loader._tile_cache_bytes <= 2 * 1024
+
+
+def test_tile_cache_skips_tiles_larger_than_budget(level_map, monkeypatch):
+    map_path, _ = level_map
+    monkeypatch.setattr(tile_loader, 'MAX_TILE_CACHE_BYTES', 100)
+    
+    load_tile(get_level_folder(map_path, 0, 6) / '0_0.png')
+    assert not tile_loader._tile_cache
+    assert tile_loader._tile_cache_bytes == 0
+
+
+def test_max_size_drafts_jpeg_then_thumbnails_to_fit(tmp_path, monkeypatch):
+    path = tmp_path / '0_0.jpg'
+    random_image(200, 100).convert('RGB').save(path, quality=95)
+    
+    drafts = []
+    draft = JpegImageFile.draft
+    def spy(self, mode, size):
+        result = draft(self, mode, size)
+        drafts.append((size, self.size))
+        return result
+    monkeypatch.setattr(JpegImageFile, 'draft', spy)
+    
+    img = load_tile(path, max_size=(30, 30))
+    assert img.size == (30, 15)
+    assert img.mode == 'RGBA'
+    # Decoded at 1/2 scale (1/4 would make the height 25 < 30), then shrunk
+    assert drafts == [((30, 30), (100, 50))]
+
+
+def test_max_size_is_part_of_the_tile_cache_key(level_map, monkeypatch):
+    map_path, _ = level_map
+    path = get_level_folder(map_path, 0, 6) / '0_0.png'
+    monkeypatch.setattr(tile_loader, 'MAX_TILE_CACHE_BYTES', 1024 * 1024)
+    
+    full = load_tile(path)
+    small = load_tile(path, max_size=(4, 4))
+    assert (full.size, small.size) == ((16, 16), (4, 4))
+    assert load_tile(path) is full
+    assert load_tile(path, max_size=(4, 4)) is small
+    assert len(tile_loader._tile_cache) == 2
+    
+    # A list is the same size limit as the equal tuple
+    assert load_tile(path, max_size=[4, 4]) is small
+    assert load_tile(path, max_size=[8, 8]).size == (8, 8)
+    assert len(tile_loader._tile_cache) == 3
+
+
+def test_lowering_tile_cache_budget_evicts_oldest_tiles(level_map, monkeypatch):
+    map_path, _ = level_map
+    folder = get_level_folder(map_path, 0, 6)
+    monkeypatch.setattr(tile_loader, 'MAX_TILE_CACHE_BYTES', 0)  # Restored after the test
+    
+    tile_loader.set_tile_cache_budget(3 * 1024)
+    for name in ('0_0.png', '1_0.png', '2_0.png'):
+        load_tile(folder / name)
+    assert len(tile_loader._tile_cache) == 3
+    
+    tile_loader.set_tile_cache_budget(1024)
+    assert [key[0] for key in tile_loader._tile_cache] == [str(folder / '2_0.png')]
+    assert tile_loader._tile_cache_bytes == 8 * 16 * 4  # Edge tile
+    
+    tile_loader.set_tile_cache_budget(0)
+    assert not tile_loader._tile_cache
+    with pytest.raises(ValueError):
+        tile_loader.set_tile_cache_budget(-1)
+
+
+# ---- Tile coordinates -----------------------------------------------------
+
+def _parse_with_regex(filename):
+    """Reference: the regex-only parser."""
+    if '/' in filename or os.sep in filename:
+        filename = Path(filename).name
+    match = tile_loader._COORD_RE.match(filename)
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+@pytest.mark.parametrize('filename, expected', [
+    ('5_10.webp', (5, 10)),
+    ('0_0.png', (0, 0)),
+    ('05_010.jpg', (5, 10)),
+    ('12345_67890.jpeg', (12345, 67890)),
+    ('layer0_files/15/3_4.webp', (3, 4)),
+    ('3_4.we_bp', (3, 4)),        # \w allows '_' in the extension
+    ('3_4.png\n', (3, 4)),        # $ matches before a trailing newline
+    ('\u0663_\u0664.png', (3, 4)),  # Unicode decimal digits, like \d
+    ('5_10', None),
+    ('5_10.', None),
+    ('_10.webp', None),
+    ('5_.webp', None),
+    ('5__10.webp', None),
+    ('5_10_3.webp', None),
+    ('-1_2.png', None),
+    (' 1_2.png', None),
+    ('a_10.webp', None),
+    ('5_10.tar.gz', None),
+    ('5.10.webp', None),
+    ('Thumbs.db', None),
+    ('', None),
+])
+def test_parse_tile_coords_edge_cases(filename, expected):
+    assert parse_tile_coords_or_none(filename) == expected
+    assert _parse_with_regex(filename) == expected
+    
+    if expected is None:
+        with pytest.raises(ValueError):
+            parse_tile_coords(filename)
+    else:
+        assert parse_tile_coords(filename) == expected
+
+
+def test_parse_tile_coords_matches_regex_on_random_names():
+    rng = random.Random(0)
+    alphabet = '0123456789__..ab/ \n\u0663'
+    for _ in range(20000):
+        name = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 9)))
+        assert parse_tile_coords_or_none(name) == _parse_with_regex(name), repr(name)
+
+
+# ---- Scanning -------------------------------------------------------------
+
+def test_scan_lists_tiles_sorted_and_skips_non_tiles(tmp_path, caplog):
+    folder = tmp_path / 'base_top' / 'layer0_files' / '3'
+    folder.mkdir(parents=True)
+    tile = Image.new('RGB', (4, 4))
+    for name in ('1_0.webp', '0_1.webp', '0_0.webp', '10_0.WEBP', '2_0.png'):
+        tile.save(folder / name, format='PNG')
+    (folder / 'Thumbs.db').write_bytes(b'')
+    (folder / 'notes.txt').write_text('')
+    (folder / 'bad.webp').write_bytes(b'')
+    (folder / '5_5.webp').mkdir()  # Directory named like a tile
+    
+    tiles = scan_tiles_for_level(tmp_path / 'base_top', 0, 3)
+    assert [(t['x'], t['y']) for t in tiles] == [(0, 0), (1, 0), (2, 0), (10, 0), (0, 1)]
+    assert all(t['path'].parent == folder for t in tiles)
+    assert all(set(t) == {'x', 'y', 'path'} for t in tiles)
+    assert 'bad.webp' in caplog.text
+    
+    webp = scan_tiles_for_level(tmp_path / 'base_top', 0, 3, tile_format='webp')
+    assert sorted(t['path'].name for t in webp) == ['0_0.webp', '0_1.webp', '10_0.WEBP', '1_0.webp']
+
+
+def test_scan_missing_level_returns_no_tiles(tmp_path):
+    assert scan_tiles_for_level(tmp_path / 'base_top', 0, 3) == []
+
+
+# ---- Tile bounds ----------------------------------------------------------
+
+def _bounds_two_pass(tiles):
+    """Reference: min/max over all tiles, then edge tile sizes."""
+    max_x = max(t['x'] for t in tiles)
+    max_y = max(t['y'] for t in tiles)
+    min_x = min(t['x'] for t in tiles)
+    min_y = min(t['y'] for t in tiles)
+    return {
+        'min_x': min_x, 'min_y': min_y, 'max_x': max_x, 'max_y': max_y,
+        'cols': max_x - min_x + 1, 'rows': max_y - min_y + 1,
+        'rightmost_width': max(t['size'][0] for t in tiles if t['x'] == max_x),
+        'bottommost_height': max(t['size'][1] for t in tiles if t['y'] == max_y),
+    }
+
+
+def test_tile_bounds_match_two_pass_reference():
+    rng = random.Random(0)
+    for _ in range(500):
+        tiles = [{'x': rng.randint(0, 9), 'y': rng.randint(0, 9),
+                  'size': (rng.randint(1, 300), rng.randint(1, 300))}
+                 for _ in range(rng.randint(1, 30))]
+        rng.shuffle(tiles)
+        assert get_tile_bounds(tiles) == _bounds_two_pass(tiles)
+
+
+def test_tile_bounds_read_edge_tile_sizes_from_headers(level_map):
+    map_path, _ = level_map
+    tiles = scan_tiles_for_level(map_path, 0, 6)
+    assert get_tile_bounds(tiles) == {
+        'min_x': 0, 'min_y': 0, 'max_x': 2, 'max_y': 1, 'cols': 3, 'rows': 2,
+        'rightmost_width': 8, 'bottommost_height': 8,
+    }
+    assert get_tile_bounds([])['cols'] == 0
+
+
+# ---- Lazy tiles -----------------------------------------------------------
+
+def test_lazy_tiles_work_like_eager_tile_dicts(level_map):
+    map_path, _ = level_map
+    eager = load_tiles_for_level(map_path, 0, 6, eager=True, max_workers=1)
+    lazy = load_tiles_for_level(map_path, 0, 6)
+    
+    assert len(lazy) == len(eager)
+    for lazy_tile, eager_tile in zip(lazy, eager):
+        assert isinstance(lazy_tile, tile_loader.LazyTile)
+        assert list(lazy_tile.keys()) == list(eager_tile.keys())
+        assert lazy_tile.get('size') == eager_tile['size']
+        assert lazy_tile.get('missing', 'default') == 'default'
+        assert 'image' in lazy_tile and 'missing' not in lazy_tile
+        
+        as_dict = dict(lazy_tile)
+        assert _pixels(as_dict.pop('image')) == _pixels(eager_tile['image'])
+        assert as_dict == {k: v for k, v in eager_tile.items() if k != 'image'}
+
+
+def test_tiles_stream_as_rgba_and_only_eager_opaque_tiles_are_narrowed(tmp_path):
+    image = random_image(32, 16, alphas=(255,))
+    image.paste((0, 0, 0, 128), (16, 0, 17, 1))  # One translucent pixel in tile 1_0
+    map_path = write_map(tmp_path / 'base_top', image)
+    
+    lazy = load_tiles_for_level(map_path, 0, 5)
+    eager = load_tiles_for_level(map_path, 0, 5, eager=True, max_workers=1)
+    assert [t['has_alpha'] for t in lazy] == [t['has_alpha'] for t in eager] == [False, True]
+    assert [t['image'].mode for t in lazy] == ['RGBA', 'RGBA']
+    assert [t['image'].mode for t in eager] == ['RGB', 'RGBA']
+    assert load_tile(lazy[0]['path']).mode == 'RGBA'
+    
+    decoded = list(tile_loader._iter_decoded_tiles(scan_tiles_for_level(map_path, 0, 5)))
+    assert [alpha_range for _, _, alpha_range in decoded] == [(255, 255), (128, 255)]
+
+
+def test_lazy_tile_decodes_only_when_image_is_read(level_map):
+    map_path, _ = level_map
+    tile = load_tiles_for_level(map_path, 0, 6)[-1]
+    
+    assert tile['size'] == (8, 8)
+    assert 'not loaded' in repr(tile)
+    assert tile['image'].size == (8, 8)
+    assert 'not loaded' not in repr(tile)
+    
+    with pytest.raises(KeyError):
+        tile['missing']
+
+
+def test_lazy_tiles_compare_without_decoding(level_map, monkeypatch):
+    map_path, _ = level_map
+    first = load_tiles_for_level(map_path, 0, 6)
+    second = load_tiles_for_level(map_path, 0, 6)
+    
+    def fail(*args):
+        raise AssertionError("tile decoded for a comparison")
+    monkeypatch.setattr(tile_loader, '_load_tile', fail)
+    
+    assert first == second
+    assert first[0] != second[1]
+    assert len(set(first + second)) == 6
+    assert first[0] != dict(x=0, y=0)
+
+
+def test_packed_lazy_tiles_keep_their_pack_location(level_map, monkeypatch):
+    map_path, _ = level_map
+    folder = get_level_folder(map_path, 0, 6)
+    expected = {p.name: _pixels(Image.open(p)) for p in folder.iterdir()}
+    pack_level(map_path, 0, 6)
+    shutil.rmtree(folder)
+    
+    lazy = load_tiles_for_level(map_path, 0, 6)
+    
+    def fail(*args):
+        raise AssertionError("pack location looked up again")
+    monkeypatch.setattr(tile_loader, '_find_packed_tile', fail)
+    
+    assert get_tile_bounds(lazy)['rightmost_width'] == 8
+    decoded = list(tile_loader.iter_tile_images(lazy, max_workers=1))
+    assert len(decoded) == 6
+    for tile, img in decoded:
+        assert _pixels(img) == expected[tile['path'].name]
+
+
+# ---- Tile existence -------------------------------------------------------
+
+def test_check_tile_exists_ignores_case(tmp_path):
+    folder = tmp_path / 'base_top' / 'layer0_files' / '3'
+    folder.mkdir(parents=True)
+    (folder / '0_16.WEBP').write_bytes(b'')
+    (folder / '1_16.png').write_bytes(b'')
+    map_path = tmp_path / 'base_top'
+    
+    assert check_tile_exists(map_path, 0, 3, 0, 16) == folder / '0_16.WEBP'
+    assert check_tile_exists(map_path, 0, 3, 1, 16) == folder / '1_16.png'
+    assert check_tile_exists(map_path, 0, 3, 1, 16, formats=['PNG']) == folder / '1_16.png'
+    assert check_tile_exists(map_path, 0, 3, 2, 16) is None
+
+
+def test_check_tile_exists_ignores_case_in_packs(level_map):
+    map_path, _ = level_map
+    folder = get_level_folder(map_path, 0, 6)
+    (folder / '0_0.png').rename(folder / '0_0.PNG')
+    pack_level(map_path, 0, 6)
+    shutil.rmtree(folder)
+    
+    assert check_tile_exists(map_path, 0, 6, 0, 0, formats=['png']) == folder / '0_0.PNG'
+    assert load_tile(folder / '0_0.PNG').size == (16, 16)